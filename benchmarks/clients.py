@@ -0,0 +1,187 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+
+@dataclass
+class BenchResponse:
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def json(self):
+        return json.loads(self.body)
+
+
+def encode_body(json_body=None, form_body: Optional[dict] = None) -> Tuple[bytes, Dict[str, str]]:
+    if json_body is not None:
+        return json.dumps(json_body).encode(), {"content-type": "application/json"}
+
+    if form_body is not None:
+        return urlencode(form_body).encode(), {"content-type": "application/x-www-form-urlencoded"}
+
+    return b"", {}
+
+
+class ASGIClient:
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method: str, path: str, headers: Optional[Dict[str, str]] = None,
+                      json_body=None, form_body: Optional[dict] = None) -> BenchResponse:
+        body, body_headers = encode_body(json_body, form_body)
+        all_headers = {**body_headers, **(headers or {}), "content-length": str(len(body)), "host": "bench"}
+        path, _, query = path.partition("?")
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in all_headers.items()],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+        }
+
+        request_sent = False
+        response_done = asyncio.Event()
+        status = 500
+        response_headers: Dict[str, str] = {}
+        chunks = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.update(
+                    (key.decode().lower(), value.decode()) for key, value in message.get("headers", [])
+                )
+
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_done.set()
+
+        await self.app(scope, receive, send)
+        response_done.set()
+        return BenchResponse(status=status, body=b"".join(chunks), headers=response_headers)
+
+    async def close(self):
+        pass
+
+
+class ASGILifespan:
+    def __init__(self, app):
+        self.app = app
+        self._receive_queue: asyncio.Queue = asyncio.Queue()
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _call(self, event: str):
+        await self._receive_queue.put({"type": f"lifespan.{event}"})
+        message = await self._send_queue.get()
+        if message["type"] != f"lifespan.{event}.complete":
+            raise RuntimeError(f"Lifespan {event} завершился с ошибкой: {message.get('message', '')}")
+
+    async def startup(self):
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._task = asyncio.create_task(self.app(scope, self._receive_queue.get, self._send_queue.put))
+        await self._call("startup")
+
+    async def shutdown(self):
+        if self._task is None:
+            return
+
+        await self._call("shutdown")
+        await self._task
+        self._task = None
+
+
+class HTTPClient:
+    def __init__(self, base_url: str):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, headers: Optional[Dict[str, str]] = None,
+                      json_body=None, form_body: Optional[dict] = None) -> BenchResponse:
+        body, body_headers = encode_body(json_body, form_body)
+        all_headers = {
+            "host": f"{self.host}:{self.port}",
+            "connection": "keep-alive",
+            **body_headers,
+            **(headers or {}),
+            "content-length": str(len(body)),
+        }
+
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+        head = f"{method} {path} HTTP/1.1\r\n" + "".join(f"{key}: {value}\r\n" for key, value in all_headers.items())
+        self._writer.write(head.encode() + b"\r\n" + body)
+        await self._writer.drain()
+
+        try:
+            return await self._read_response()
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.close()
+            raise
+
+    async def _read_response(self) -> BenchResponse:
+        status_line = await self._reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self._reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+
+            key, _, value = line.decode().partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding") == "chunked":
+            chunks = []
+            while True:
+                size = int((await self._reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                data = await self._reader.readexactly(size + 2)
+                if size == 0:
+                    break
+
+                chunks.append(data[:-2])
+
+            body = b"".join(chunks)
+
+        else:
+            body = await self._reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection") == "close":
+            await self.close()
+
+        return BenchResponse(status=status, body=body, headers=headers)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+        self._reader = None
+        self._writer = None
@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import sys
+import time
+from functools import partial
+
+from benchmarks.clients import ASGIClient, ASGILifespan, HTTPClient
+from benchmarks.scenarios import SCENARIOS, run_phase, seed
+from benchmarks.stats import compare_with_baseline, print_summary, save_baseline
+
+
+def build_client_factory(args):
+    if args.target == "http":
+        return partial(HTTPClient, args.base_url)
+
+    from src.main import app
+    return partial(ASGIClient, app)
+
+
+def startup_summary(seconds: float) -> dict:
+    return {
+        "lifespan": {
+            "count": 1,
+            "errors": 0,
+            "throughput_rps": 0.0,
+            "p50_ms": seconds * 1000,
+            "p95_ms": seconds * 1000,
+            "p99_ms": seconds * 1000,
+        }
+    }
+
+
+async def main(args) -> int:
+    client_factory = build_client_factory(args)
+    results = {}
+
+    lifespan = None
+    if args.target == "asgi":
+        lifespan = ASGILifespan(client_factory.args[0])
+        started = time.perf_counter()
+        await lifespan.startup()
+        results["startup"] = startup_summary(time.perf_counter() - started)
+        print_summary(f"startup ({args.target})", results["startup"])
+
+    try:
+        setup_client = client_factory()
+        try:
+            ctx = await seed(setup_client, users=args.users, animals=args.animals)
+
+        finally:
+            await setup_client.close()
+
+        for name in args.scenario:
+            for phase in SCENARIOS[name](args.concurrency):
+                summary = await run_phase(client_factory, ctx, phase, args.duration, args.seed)
+                results[f"{name}:{phase.name}"] = summary
+                print_summary(f"{name} / {phase.name} ({args.target})", summary)
+
+    finally:
+        if lifespan is not None:
+            await lifespan.shutdown()
+
+    baseline_name = f"{args.target}-{'+'.join(args.scenario)}"
+
+    if args.save_baseline:
+        path = save_baseline(baseline_name, results)
+        print(f"\nБазовая линия сохранена в {path}")
+
+    if args.compare:
+        regressions = compare_with_baseline(baseline_name, results, args.tolerance)
+        if regressions:
+            print("\nРегрессии относительно базовой линии:")
+            for line in regressions:
+                print(f"  {line}")
+
+            return 1
+
+        print("\nРегрессий относительно базовой линии нет")
+
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузочное тестирование API")
+    parser.add_argument("--target", choices=("asgi", "http"), default="asgi")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS))
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--animals", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,200 @@
+import asyncio
+import base64
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from benchmarks.clients import BenchResponse
+from benchmarks.stats import Recorder
+
+SPECIES = ("zebra", "lion", "tiger", "panda", "koala", "otter", "lemur", "bison")
+PASSWORD = "bench-password"
+
+Operation = Callable[[Any, "BenchContext", random.Random], Awaitable[Tuple[str, BenchResponse]]]
+
+
+@dataclass
+class BenchUser:
+    username: str
+    token: str
+    user_id: int
+
+
+@dataclass
+class BenchContext:
+    users: List[BenchUser] = field(default_factory=list)
+    animal_ids: List[int] = field(default_factory=list)
+
+    def auth(self, rng: random.Random) -> Tuple[BenchUser, Dict[str, str]]:
+        user = rng.choice(self.users)
+        return user, {"authorization": f"Bearer {user.token}"}
+
+
+@dataclass
+class Phase:
+    name: str
+    workers: List[Tuple[int, Operation]]
+
+
+def _token_user_id(token: str) -> int:
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return int(json.loads(base64.urlsafe_b64decode(payload))["user_id"])
+
+
+async def seed(client, users: int, animals: int) -> BenchContext:
+    ctx = BenchContext()
+    run_id = uuid.uuid4().hex[:6]
+
+    for index in range(users):
+        username = f"b{run_id}{index:03d}"
+        response = await client.request("POST", "/auth/register", json_body={"username": username, "password": PASSWORD})
+        if response.status != 200:
+            raise RuntimeError(f"Не удалось зарегистрировать {username}: {response.status} {response.body!r}")
+
+        token = response.json()["access_token"]
+        ctx.users.append(BenchUser(username=username, token=token, user_id=_token_user_id(token)))
+
+    _, headers = ctx.auth(random.Random(0))
+    rng = random.Random(1)
+    for start in range(0, animals, 1000):
+        batch = [
+            {"species": rng.choice(SPECIES), "age": rng.randint(0, 50)}
+            for _ in range(min(1000, animals - start))
+        ]
+        response = await client.request("POST", "/animals/bulk_create", headers=headers, json_body=batch)
+        if response.status != 200:
+            raise RuntimeError(f"Не удалось создать животных: {response.status} {response.body!r}")
+
+        ctx.animal_ids.extend(animal["id"] for animal in response.json()["created"])
+
+    return ctx
+
+
+async def login(client, ctx: BenchContext, rng: random.Random):
+    user = rng.choice(ctx.users)
+    response = await client.request("POST", "/auth/login", form_body={"username": user.username, "password": PASSWORD})
+    return "POST /auth/login", response
+
+
+async def register(client, ctx: BenchContext, rng: random.Random):
+    username = f"r{uuid.uuid4().hex[:12]}"
+    response = await client.request("POST", "/auth/register", json_body={"username": username, "password": PASSWORD})
+    return "POST /auth/register", response
+
+
+async def get_animal(client, ctx: BenchContext, rng: random.Random):
+    _, headers = ctx.auth(rng)
+    response = await client.request("GET", f"/animals/get_animal_by_id/{rng.choice(ctx.animal_ids)}", headers=headers)
+    return "GET /animals/get_animal_by_id", response
+
+
+async def lookup_animals(client, ctx: BenchContext, rng: random.Random):
+    # get_animals_by_ids не кешируется, поэтому каждый вызов берёт соединение из пула
+    _, headers = ctx.auth(rng)
+    ids = "&".join(f"ids={animal_id}" for animal_id in rng.sample(ctx.animal_ids, min(5, len(ctx.animal_ids))))
+    response = await client.request("GET", f"/animals/get_animals_by_ids?{ids}", headers=headers)
+    return "GET /animals/get_animals_by_ids", response
+
+
+async def browse_species(client, ctx: BenchContext, rng: random.Random):
+    _, headers = ctx.auth(rng)
+    path = f"/animals/get_animals_by_species?species={rng.choice(SPECIES)}&limit=50"
+
+    cursor = None
+    for _ in range(rng.randint(1, 5)):
+        response = await client.request("GET", path + (f"&cursor={cursor}" if cursor else ""), headers=headers)
+        if response.status != 200:
+            break
+
+        cursor = response.json()["next_cursor"]
+        if not cursor:
+            break
+
+    return "GET /animals/get_animals_by_species", response
+
+
+async def search_species(client, ctx: BenchContext, rng: random.Random):
+    _, headers = ctx.auth(rng)
+    species = rng.choice(SPECIES)
+    start = rng.randint(0, len(species) - 3)
+    match, query = rng.choice((("prefix", species[:3]), ("substring", species[start:start + 3])))
+
+    response = await client.request("GET", f"/animals/search?query={query.upper()}&match={match}&limit=50", headers=headers)
+    return f"GET /animals/search ({match})", response
+
+
+async def autocomplete_species(client, ctx: BenchContext, rng: random.Random):
+    _, headers = ctx.auth(rng)
+    prefix = rng.choice(SPECIES)[:rng.randint(0, 2)]
+    response = await client.request("GET", f"/animals/species/autocomplete?prefix={prefix}", headers=headers)
+    return "GET /animals/species/autocomplete", response
+
+
+async def adopt_release(client, ctx: BenchContext, rng: random.Random):
+    user, headers = ctx.auth(rng)
+    animal_id = rng.choice(ctx.animal_ids)
+
+    response = await client.request("POST", f"/auth/adopt_animal/{user.user_id}/{animal_id}", headers=headers)
+    if response.status == 200:
+        response = await client.request("POST", f"/auth/release_animal/{user.user_id}/{animal_id}", headers=headers)
+
+    return "POST adopt+release", response
+
+
+SCENARIOS: Dict[str, Callable[[int], List[Phase]]] = {
+    "login_storm": lambda concurrency: [
+        Phase("idle", [(max(1, concurrency // 4), get_animal), (max(1, concurrency // 4), lookup_animals)]),
+        Phase("storm", [
+            (concurrency, login), (max(1, concurrency // 8), register),
+            (max(1, concurrency // 4), get_animal), (max(1, concurrency // 4), lookup_animals),
+        ]),
+    ],
+    "species_browsing": lambda concurrency: [
+        Phase("browse", [(concurrency, browse_species)]),
+    ],
+    "species_search": lambda concurrency: [
+        Phase("search", [(max(1, concurrency // 2), search_species), (max(1, concurrency // 2), autocomplete_species)]),
+    ],
+    "adopt_release": lambda concurrency: [
+        Phase("mixed", [(max(1, concurrency // 2), adopt_release), (max(1, concurrency // 2), get_animal)]),
+    ],
+}
+
+
+async def run_phase(client_factory, ctx: BenchContext, phase: Phase, duration: float, seed_value: int) -> Dict[str, dict]:
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    async def worker(operation: Operation, rng: random.Random):
+        client = client_factory()
+        try:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    label, response = await operation(client, ctx, rng)
+                    ok = response.status < 400
+
+                except Exception:
+                    label, ok = operation.__name__, False
+
+                recorder.record(label, time.perf_counter() - start, ok)
+                # Ответ из кеша обходится без единого переключения задач, и в ASGI-режиме такие
+                # воркеры не отдавали бы цикл событий запросам, ожидающим базу
+                await asyncio.sleep(0)
+
+        finally:
+            await client.close()
+
+    tasks = []
+    for group, (count, operation) in enumerate(phase.workers):
+        for index in range(count):
+            rng = random.Random(seed_value * 1_000_003 + group * 1000 + index)
+            tasks.append(worker(operation, rng))
+
+    started = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return recorder.summary(time.perf_counter() - started)
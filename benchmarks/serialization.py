@@ -0,0 +1,47 @@
+import argparse
+import json
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+
+from src.core.dtos.zoo_dto import AnimalPage, AnimalSchema
+from src.core.utils.serialization import animal_list_adapter
+
+
+def make_rows(count: int):
+    now = datetime.utcnow()
+    return [
+        SimpleNamespace(id=i, species="zebra", age=i % 50, created_at=now, master_id=None)
+        for i in range(1, count + 1)
+    ]
+
+
+def serialize_before(rows) -> bytes:
+    page = AnimalPage(items=[AnimalSchema.model_validate(row) for row in rows])
+    validated = AnimalPage.model_validate(page.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def serialize_after(rows) -> bytes:
+    page = AnimalPage(items=animal_list_adapter.validate_python(rows, from_attributes=True))
+    return page.model_dump_json().encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Стоимость сериализации списка животных")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    assert json.loads(serialize_before(rows)) == json.loads(serialize_after(rows))
+
+    for name, func in (("before", serialize_before), ("after", serialize_after)):
+        best = min(timeit.repeat(lambda: func(rows), number=1, repeat=args.repeat))
+        print(f"{name:>6}: {best * 1000:8.2f} ms total, {best / args.rows * 1e6:6.2f} us/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import cProfile
+import pstats
+import sys
+import time
+from typing import Callable, Dict, Tuple
+
+from sqlalchemy import Integer, bindparam, select
+from sqlalchemy.dialects import postgresql
+
+from src.core.models.models import Animal, User
+from src.core.repositories.animals_repository import AnimalsRepository
+from src.core.repositories.user_repository import UserRepository
+
+DIALECT = postgresql.dialect()
+
+
+def rebuilt_find_one():
+    return select(Animal).where(Animal.id == bindparam("inst_id", type_=Integer))
+
+
+def cached_find_one():
+    return AnimalsRepository._cached_statement(("bench", "find_one"), rebuilt_find_one)
+
+
+def rebuilt_user_by_username():
+    return select(User).where(User.username == bindparam("username"))
+
+
+def cached_user_by_username():
+    return UserRepository._cached_statement(("bench", "get_user_by_username"), rebuilt_user_by_username)
+
+
+def rebuilt_species_page():
+    return AnimalsRepository(session=None)._page_statement("id", True, (Animal.species == bindparam("species"),))
+
+
+def cached_species_page():
+    return AnimalsRepository._cached_statement(("bench", "species_page"), rebuilt_species_page)
+
+
+QUERIES: Dict[str, Tuple[Callable, Callable]] = {
+    "find_one": (rebuilt_find_one, cached_find_one),
+    "get_user_by_username": (rebuilt_user_by_username, cached_user_by_username),
+    "get_animals_by_species": (rebuilt_species_page, cached_species_page),
+}
+
+
+def per_call(build: Callable, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        build()._generate_cache_key()
+
+    return (time.perf_counter() - started) / iterations
+
+
+def compile_cost(build: Callable, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        build().compile(dialect=DIALECT)
+
+    return (time.perf_counter() - started) / iterations
+
+
+def profile_calls(build: Callable, iterations: int) -> int:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(iterations):
+        build()._generate_cache_key()
+
+    profiler.disable()
+    return pstats.Stats(profiler).total_calls // iterations
+
+
+def main(args) -> int:
+    print(f"{'query':<26}{'variant':<10}{'us/call':>10}{'calls':>8}")
+    for name, (rebuilt, cached) in QUERIES.items():
+        for variant, build in (("rebuilt", rebuilt), ("cached", cached)):
+            build()._generate_cache_key()
+            print(
+                f"{name:<26}{variant:<10}{per_call(build, args.iterations) * 1e6:>10.2f}"
+                f"{profile_calls(build, args.profile_iterations):>8}"
+            )
+
+        print(f"{name:<26}{'compile':<10}{compile_cost(rebuilt, args.profile_iterations) * 1e6:>10.2f}")
+
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Накладные расходы на построение SQL-запросов")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--profile-iterations", type=int, default=1000)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
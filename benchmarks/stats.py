@@ -0,0 +1,81 @@
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, label: str, latency: float, ok: bool):
+        self.latencies[label].append(latency)
+        if not ok:
+            self.errors[label] += 1
+
+    def summary(self, duration: float) -> Dict[str, dict]:
+        result = {}
+        for label, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            result[label] = {
+                "count": len(ordered),
+                "errors": self.errors[label],
+                "throughput_rps": len(ordered) / duration if duration else 0.0,
+                "p50_ms": percentile(ordered, 50) * 1000,
+                "p95_ms": percentile(ordered, 95) * 1000,
+                "p99_ms": percentile(ordered, 99) * 1000,
+            }
+
+        return result
+
+
+def print_summary(title: str, summary: Dict[str, dict]):
+    print(f"\n== {title}")
+    print(f"{'label':<32}{'count':>8}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for label, stats in summary.items():
+        print(
+            f"{label:<32}{stats['count']:>8}{stats['errors']:>8}{stats['throughput_rps']:>10.1f}"
+            f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+
+
+def save_baseline(name: str, results: Dict[str, Dict[str, dict]]) -> Path:
+    BASELINES_DIR.mkdir(exist_ok=True)
+    path = BASELINES_DIR / f"{name}.json"
+    path.write_text(json.dumps(results, indent=2, sort_keys=True))
+    return path
+
+
+def compare_with_baseline(name: str, results: Dict[str, Dict[str, dict]], tolerance: float) -> List[str]:
+    path = BASELINES_DIR / f"{name}.json"
+    baseline = json.loads(path.read_text())
+    regressions = []
+
+    for phase, labels in results.items():
+        for label, stats in labels.items():
+            old = baseline.get(phase, {}).get(label)
+            if old is None:
+                continue
+
+            for key in ("p50_ms", "p95_ms", "p99_ms"):
+                if old[key] and stats[key] > old[key] * (1 + tolerance):
+                    regressions.append(f"{phase}/{label} {key}: {old[key]:.2f} -> {stats[key]:.2f}")
+
+            if old["throughput_rps"] and stats["throughput_rps"] < old["throughput_rps"] * (1 - tolerance):
+                regressions.append(
+                    f"{phase}/{label} throughput_rps: {old['throughput_rps']:.1f} -> {stats['throughput_rps']:.1f}"
+                )
+
+    return regressions
@@ -0,0 +1,50 @@
+"""initial schema
+
+Revision ID: 3f1c9a2b7d10
+Revises: 
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a2b7d10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=16), nullable=False),
+        sa.Column('hashed_password', sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('username'),
+    )
+    op.create_table(
+        'animal',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('master_id', sa.Integer(), nullable=True),
+        sa.Column('species', sa.String(length=16), nullable=False),
+        sa.Column('age', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['master_id'], ['user.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_animal_species_id', 'animal', ['species', 'id'], unique=False)
+    op.create_index('ix_animal_master_id', 'animal', ['master_id'], unique=False)
+    op.create_index('ix_animal_created_at_id', 'animal', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_animal_created_at_id', table_name='animal')
+    op.drop_index('ix_animal_master_id', table_name='animal')
+    op.drop_index('ix_animal_species_id', table_name='animal')
+    op.drop_table('animal')
+    op.drop_table('user')
@@ -0,0 +1,41 @@
+"""species stats
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f1c9a2b7d10
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a93'
+down_revision: Union[str, None] = '3f1c9a2b7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'species_stats',
+        sa.Column('species', sa.String(length=16), nullable=False),
+        sa.Column('animal_count', sa.Integer(), nullable=False),
+        sa.Column('age_sum', sa.BigInteger(), nullable=False),
+        sa.Column('adopted_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('species'),
+    )
+    op.execute(
+        """
+        INSERT INTO species_stats (species, animal_count, age_sum, adopted_count)
+        SELECT species, count(*), coalesce(sum(age), 0), count(master_id)
+        FROM animal
+        GROUP BY species
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('species_stats')
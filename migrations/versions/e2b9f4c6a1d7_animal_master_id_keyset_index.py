@@ -0,0 +1,32 @@
+"""animal master_id keyset index
+
+Revision ID: e2b9f4c6a1d7
+Revises: c4a7e1d2b5f8
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9f4c6a1d7'
+down_revision: Union[str, None] = 'c4a7e1d2b5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_animal_master_id_id', 'animal', ['master_id', 'id'], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index('ix_animal_master_id', table_name='animal', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_animal_master_id', 'animal', ['master_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_animal_master_id_id', table_name='animal', postgresql_concurrently=True)
@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 import sys
 from pydantic import BaseModel
@@ -16,11 +17,51 @@ class DBSettings(BaseSettings):
     user: str = Field(env="DB_USER")
     password: str = Field(env="DB_PASS")
     name: str = Field(env="DB_NAME")
+    pool_size: int = Field(env="DB_POOL_SIZE", default=5)
+    max_overflow: int = Field(env="DB_MAX_OVERFLOW", default=10)
+    pool_timeout: float = Field(env="DB_POOL_TIMEOUT", default=30.0)
+    pool_recycle: int = Field(env="DB_POOL_RECYCLE", default=1800)
+    pool_pre_ping: bool = Field(env="DB_POOL_PRE_PING", default=True)
+    statement_cache_size: int = Field(env="DB_STATEMENT_CACHE_SIZE", default=100)
+    prepared_statement_cache_size: int = Field(env="DB_PREPARED_STATEMENT_CACHE_SIZE", default=100)
+    warmup_connections: int = Field(env="DB_WARMUP_CONNECTIONS", default=2)
+    replica_host: Optional[str] = Field(env="DB_REPLICA_HOST", default=None)
+    replica_port: Optional[int] = Field(env="DB_REPLICA_PORT", default=None)
+    replica_connect_timeout: float = Field(env="DB_REPLICA_CONNECT_TIMEOUT", default=2.0)
+    replica_retry_seconds: float = Field(env="DB_REPLICA_RETRY_SECONDS", default=5.0)
+    replica_sticky_seconds: float = Field(env="DB_REPLICA_STICKY_SECONDS", default=0.0)
 
     @property
     def db_url(self):
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
+    @property
+    def replica_db_url(self):
+        if not self.replica_host:
+            return None
+
+        return f"postgresql+asyncpg://{self.user}:{self.password}@{self.replica_host}:{self.replica_port or self.port}/{self.name}"
+
+    @property
+    def replica_engine_options(self):
+        options = self.engine_options
+        options["connect_args"] = {**options["connect_args"], "timeout": self.replica_connect_timeout}
+        return options
+
+    @property
+    def engine_options(self):
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "connect_args": {
+                "statement_cache_size": self.statement_cache_size,
+                "prepared_statement_cache_size": self.prepared_statement_cache_size,
+            },
+        }
+
 @dataclass
 class Settings:
     SECRET_KEY: str = os.getenv("access_secret_key")
@@ -29,6 +70,34 @@ class Settings:
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int =  30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60*24*15
+    HASHER_EXECUTOR: str = os.getenv("HASHER_EXECUTOR", "thread")
+    HASHER_MAX_WORKERS: int = int(os.getenv("HASHER_MAX_WORKERS", 4))
+    HASHER_MAX_CONCURRENCY: int = int(os.getenv("HASHER_MAX_CONCURRENCY", 16))
+    HASHER_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("HASHER_QUEUE_TIMEOUT_SECONDS", 2.0))
+    TOKEN_CACHE_MAX_SIZE: int = int(os.getenv("TOKEN_CACHE_MAX_SIZE", 10000))
+    TOKEN_CACHE_TTL_SECONDS: float = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", 300))
+    PAGE_SIZE_DEFAULT: int = int(os.getenv("PAGE_SIZE_DEFAULT", 50))
+    PAGE_SIZE_MAX: int = int(os.getenv("PAGE_SIZE_MAX", 500))
+    BATCH_LOOKUP_MAX_IDS: int = int(os.getenv("BATCH_LOOKUP_MAX_IDS", 100))
+    BULK_OWNERSHIP_MAX_IDS: int = int(os.getenv("BULK_OWNERSHIP_MAX_IDS", 500))
+    SPECIES_SEARCH_MIN_LENGTH: int = int(os.getenv("SPECIES_SEARCH_MIN_LENGTH", 2))
+    SPECIES_SUGGEST_LIMIT_MAX: int = int(os.getenv("SPECIES_SUGGEST_LIMIT_MAX", 50))
+    SPECIES_INDEX_TTL_SECONDS: float = float(os.getenv("SPECIES_INDEX_TTL_SECONDS", 30))
+    BULK_CREATE_MAX_ROWS: int = int(os.getenv("BULK_CREATE_MAX_ROWS", 50000))
+    BULK_INSERT_BATCH_SIZE: int = int(os.getenv("BULK_INSERT_BATCH_SIZE", 1000))
+    BULK_COPY_THRESHOLD: int = int(os.getenv("BULK_COPY_THRESHOLD", 5000))
+    EXPORT_CHUNK_SIZE: int = int(os.getenv("EXPORT_CHUNK_SIZE", 1000))
+    ANIMAL_CACHE_BACKEND: str = os.getenv("ANIMAL_CACHE_BACKEND", "memory")
+    ANIMAL_CACHE_MAX_SIZE: int = int(os.getenv("ANIMAL_CACHE_MAX_SIZE", 10000))
+    ANIMAL_CACHE_TTL_SECONDS: float = float(os.getenv("ANIMAL_CACHE_TTL_SECONDS", 60))
+    ANIMAL_CACHE_REDIS_HOST: str = os.getenv("ANIMAL_CACHE_REDIS_HOST", "localhost")
+    ANIMAL_CACHE_REDIS_PORT: int = int(os.getenv("ANIMAL_CACHE_REDIS_PORT", 6379))
+    ANIMAL_CACHE_REDIS_DB: int = int(os.getenv("ANIMAL_CACHE_REDIS_DB", 0))
+    ANIMAL_CACHE_REDIS_PASSWORD: Optional[str] = os.getenv("ANIMAL_CACHE_REDIS_PASSWORD")
+    ANIMAL_CACHE_REDIS_TIMEOUT_SECONDS: float = float(os.getenv("ANIMAL_CACHE_REDIS_TIMEOUT_SECONDS", 0.5))
+    CHANGE_FEED_QUEUE_SIZE: int = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", 256))
+    CHANGE_FEED_HEARTBEAT_SECONDS: float = float(os.getenv("CHANGE_FEED_HEARTBEAT_SECONDS", 15))
+    CHANGE_FEED_RECONNECT_SECONDS: float = float(os.getenv("CHANGE_FEED_RECONNECT_SECONDS", 1))
 
 
 class TunedModel(BaseModel):
@@ -0,0 +1,22 @@
+import asyncio
+
+from src.core.models.session_factory import database
+from src.core.repositories.species_stats_repository import SpeciesStatsRepository
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_species_stats():
+    async with database.session_factory() as session:
+        await SpeciesStatsRepository(session).rebuild()
+        await session.commit()
+
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(rebuild_species_stats())
+    logger.info("Статистика по видам пересчитана")
@@ -1,13 +1,14 @@
 import uuid
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional
 
 from annotated_types import MinLen, MaxLen
 from pydantic import BaseModel, Field, ConfigDict
 
-from src.config.settings import TunedModel
+from src.config.settings import TunedModel, settings
 
 from _datetime import datetime
 
+from src.core.dtos.zoo_dto import AnimalPage
 from src.core.models.models import User, Animal
 
 class CreateUser(TunedModel):
@@ -44,4 +45,20 @@ class AnimalResponse(BaseModel):
 
 class AdoptAnimalResponse(BaseModel):
     master: UserResponse
-    animals: List[AnimalResponse]
+    animal: AnimalResponse
+
+class UserAnimalsPage(AnimalPage):
+    total: Optional[int] = None
+
+class BulkOwnershipRequest(BaseModel):
+    animal_ids: List[int] = Field(min_length=1, max_length=settings.BULK_OWNERSHIP_MAX_IDS)
+
+AnimalOwnershipStatus = Literal["adopted", "released", "already_owned", "owned_by_other", "not_owned", "not_found"]
+
+class AnimalOwnershipResult(BaseModel):
+    animal_id: int
+    status: AnimalOwnershipStatus
+
+class BulkOwnershipResponse(BaseModel):
+    master: UserResponse
+    results: List[AnimalOwnershipResult]
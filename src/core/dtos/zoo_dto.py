@@ -1,4 +1,4 @@
-from typing import Annotated, Optional
+from typing import Annotated, List, Literal, Optional
 
 from annotated_types import MinLen, MaxLen
 from pydantic import BaseModel, Field
@@ -17,6 +17,45 @@ class AnimalSchema(CreateAnimal):
     id: int
 
 
+class AnimalPage(BaseModel):
+    items: List[AnimalSchema]
+    next_cursor: Optional[str] = None
+
+
+AnimalOrder = Literal["id", "created_at"]
+
+SpeciesMatch = Literal["prefix", "substring"]
+
+AnimalExportFormat = Literal["ndjson", "csv"]
+
+
+class SpeciesSuggestions(BaseModel):
+    items: List[str]
+
+
+class AnimalsByIdsResponse(BaseModel):
+    items: List[AnimalSchema]
+    missing_ids: List[int]
+
+
+class BulkCreateAnimalError(BaseModel):
+    index: int
+    errors: List[str]
+
+
+class BulkCreateAnimalsResponse(BaseModel):
+    created: List[AnimalSchema]
+    errors: List[BulkCreateAnimalError]
+
+
+class SpeciesStatsSchema(BaseModel):
+    species: str
+    count: int
+    average_age: float
+    adopted: int
+    unadopted: int
+
+
 class UpdateAnimalRequest(BaseModel):
     id: int
     age: Optional[Annotated[int, Field(ge=0, le=50)]] = None
@@ -28,4 +67,16 @@ class UpdateAnimalResponse(CreateAnimal):
 
 
 class DeleteAnimalRequest(BaseModel):
-    pet_id: int
\ No newline at end of file
+    pet_id: int
+
+
+AnimalChangeType = Literal["created", "updated", "deleted", "adopted", "released"]
+
+
+class AnimalChangeEvent(BaseModel):
+    event: AnimalChangeType
+    id: int
+    species: str
+    age: int
+    master_id: Optional[int] = None
+    previous_master_id: Optional[int] = None
@@ -7,7 +7,7 @@ from src.core.repositories.uow import get_uow
 from src.core.services.animals_service import AnimalServiceProtocol, AnimalService, get_animals_repository, \
     get_animals_service
 
-from typing import Protocol, Tuple, Optional, List
+from typing import Protocol, Tuple, Optional, List, Any
 
 
 class CreateAnimalInteractor:
@@ -23,6 +23,19 @@ class CreateAnimalInteractor:
         except HTTPException as e:
             raise e
 
+class BulkCreateAnimalsInteractor:
+    def __init__(self, animal_service: AnimalServiceProtocol):
+        self.animal_service = animal_service
+
+    async def execute(self, animals_data: List[Any]) -> BulkCreateAnimalsResponse:
+        try:
+            result = await self.animal_service.create_animals(animals_data)
+
+            return result
+
+        except HTTPException as e:
+            raise e
+
 class UpdateAnimalInteractor:
     def __init__(self, animal_service: AnimalServiceProtocol):
         self.animal_service = animal_service
@@ -49,19 +62,82 @@ class GetAnimalByIdInteractor:
         except HTTPException as e:
             raise e
 
+class GetAnimalsByIdsInteractor:
+    def __init__(self, animal_service: AnimalServiceProtocol):
+        self.animal_service = animal_service
+
+    async def execute(self, ids: List[int]) -> AnimalsByIdsResponse:
+        try:
+            animals = await self.animal_service.get_animals_by_ids(ids)
+
+            return animals
+
+        except HTTPException as e:
+            raise e
+
 class GetAnimalsBySpeciesInteractor:
     def __init__(self, animal_service: AnimalServiceProtocol):
         self.animal_service = animal_service
 
-    async def execute(self, species: str) -> List[AnimalSchema]:
+    async def execute(self, species: str, limit: int, cursor: Optional[str] = None,
+                      order_by: str = "id") -> AnimalPage:
         try:
-            animals = await self.animal_service.get_animals_by_species(species)
+            animals = await self.animal_service.get_animals_by_species(species, limit, cursor, order_by)
 
             return animals
 
         except HTTPException as e:
             raise e
 
+class GetSpeciesStatsInteractor:
+    def __init__(self, animal_service: AnimalServiceProtocol):
+        self.animal_service = animal_service
+
+    async def execute(self) -> List[SpeciesStatsSchema]:
+        try:
+            stats = await self.animal_service.get_species_stats()
+
+            return stats
+
+        except HTTPException as e:
+            raise e
+
+class SearchAnimalsInteractor:
+    def __init__(self, animal_service: AnimalServiceProtocol):
+        self.animal_service = animal_service
+
+    async def execute(self, query: str, match: str, limit: int, cursor: Optional[str] = None) -> AnimalPage:
+        try:
+            animals = await self.animal_service.search_animals(query, match, limit, cursor)
+
+            return animals
+
+        except HTTPException as e:
+            raise e
+
+class SuggestSpeciesInteractor:
+    def __init__(self, animal_service: AnimalServiceProtocol):
+        self.animal_service = animal_service
+
+    async def execute(self, prefix: str, limit: int) -> SpeciesSuggestions:
+        try:
+            suggestions = await self.animal_service.suggest_species(prefix, limit)
+
+            return suggestions
+
+        except HTTPException as e:
+            raise e
+
+class ExportAnimalsInteractor:
+    def __init__(self, animal_service: AnimalServiceProtocol):
+        self.animal_service = animal_service
+
+    def execute(self, format: str, species: Optional[str] = None, owner_id: Optional[int] = None,
+                created_from: Optional[datetime] = None, created_to: Optional[datetime] = None):
+        return self.animal_service.export_animals(
+            format, species=species, owner_id=owner_id, created_from=created_from, created_to=created_to
+        )
+
 class DeleteAnimalByIdInteractor:
     def __init__(self, animal_service: AnimalServiceProtocol) -> bool:
         self.animal_service = animal_service
@@ -78,6 +154,11 @@ async def get_create_animal_interactor(
 ) -> CreateAnimalInteractor:
     return CreateAnimalInteractor(animal_service=animal_service)
 
+async def get_bulk_create_animals_interactor(
+        animal_service: AnimalServiceProtocol = Depends(get_animals_service)
+) -> BulkCreateAnimalsInteractor:
+    return BulkCreateAnimalsInteractor(animal_service=animal_service)
+
 async def get_update_animal_interactor(
         animal_service: AnimalServiceProtocol = Depends(get_animals_service)
 ) -> UpdateAnimalInteractor:
@@ -88,11 +169,36 @@ async def get_animal_by_id_interactor(
 ) -> GetAnimalByIdInteractor:
     return GetAnimalByIdInteractor(animal_service=animal_service)
 
+async def get_animals_by_ids_interactor(
+        animal_service: AnimalServiceProtocol = Depends(get_animals_service)
+) -> GetAnimalsByIdsInteractor:
+    return GetAnimalsByIdsInteractor(animal_service=animal_service)
+
 async def get_animals_by_species_interactor(
         animal_service: AnimalServiceProtocol = Depends(get_animals_service)
 ) -> GetAnimalsBySpeciesInteractor:
     return GetAnimalsBySpeciesInteractor(animal_service=animal_service)
 
+async def get_species_stats_interactor(
+        animal_service: AnimalServiceProtocol = Depends(get_animals_service)
+) -> GetSpeciesStatsInteractor:
+    return GetSpeciesStatsInteractor(animal_service=animal_service)
+
+async def get_search_animals_interactor(
+        animal_service: AnimalServiceProtocol = Depends(get_animals_service)
+) -> SearchAnimalsInteractor:
+    return SearchAnimalsInteractor(animal_service=animal_service)
+
+async def get_suggest_species_interactor(
+        animal_service: AnimalServiceProtocol = Depends(get_animals_service)
+) -> SuggestSpeciesInteractor:
+    return SuggestSpeciesInteractor(animal_service=animal_service)
+
+async def get_export_animals_interactor(
+        animal_service: AnimalServiceProtocol = Depends(get_animals_service)
+) -> ExportAnimalsInteractor:
+    return ExportAnimalsInteractor(animal_service=animal_service)
+
 async def get_delete_animal_by_id_interactor(
         animal_service: AnimalServiceProtocol = Depends(get_animals_service)
 ) -> DeleteAnimalByIdInteractor:
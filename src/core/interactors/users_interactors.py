@@ -1,13 +1,13 @@
 from fastapi import HTTPException, status
 from fastapi.params import Depends
 
-from src.core.dtos.auth_dto import TokenResponse, LoginRequest
-from src.core.dtos.user_dto import CreateUser, UserSchema
+from src.core.dtos.auth_dto import TokenResponse, LoginRequest, RefreshTokenRequest
+from src.core.dtos.user_dto import CreateUser, UserSchema, UserAnimalsPage, BulkOwnershipResponse
 
 from src.core.services.users_service import UserServiceProtocol, UserService, get_user_service
 from src.core.repositories.user_repository import UserRepository, UserRepositoryProtocol
 
-from typing import Protocol, Tuple, Optional
+from typing import Protocol, Tuple, Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,6 +42,21 @@ class AuthenticateUserInteractor:
             raise e
 
 
+class RefreshTokenInteractor:
+    def __init__(self, user_service: UserServiceProtocol):
+        self.user_service = user_service
+
+    async def execute(self, request: RefreshTokenRequest) -> TokenResponse:
+        try:
+            result = await self.user_service.refresh_tokens(request.refresh_token)
+
+            return result
+
+        except HTTPException as e:
+            logger.error(f"Ошибка при обновлении токена: {e.detail}")
+            raise e
+
+
 class AdoptAnimalInteractor:
     def __init__(self, user_service: UserServiceProtocol):
         self.user_service = user_service
@@ -72,6 +87,52 @@ class ReleaseAnimalInteractor:
             raise e
 
 
+class BulkAdoptAnimalsInteractor:
+    def __init__(self, user_service: UserServiceProtocol):
+        self.user_service = user_service
+
+    async def execute(self, user_id: int, animal_ids: List[int]) -> BulkOwnershipResponse:
+        try:
+            result = await self.user_service.adopt_animals(user_id, animal_ids)
+
+            return result
+
+        except HTTPException as e:
+            logger.error(f"Ошибка при массовом приручении животных: {e.detail}")
+            raise e
+
+
+class BulkReleaseAnimalsInteractor:
+    def __init__(self, user_service: UserServiceProtocol):
+        self.user_service = user_service
+
+    async def execute(self, user_id: int, animal_ids: List[int]) -> BulkOwnershipResponse:
+        try:
+            result = await self.user_service.release_animals(user_id, animal_ids)
+
+            return result
+
+        except HTTPException as e:
+            logger.error(f"Ошибка при массовом освобождении животных: {e.detail}")
+            raise e
+
+
+class GetUserAnimalsInteractor:
+    def __init__(self, user_service: UserServiceProtocol):
+        self.user_service = user_service
+
+    async def execute(self, user_id: int, limit: int, cursor: Optional[str] = None, order_by: str = "id",
+                      include_total: bool = False) -> UserAnimalsPage:
+        try:
+            result = await self.user_service.get_user_animals(user_id, limit, cursor, order_by, include_total)
+
+            return result
+
+        except HTTPException as e:
+            logger.error(f"Ошибка при получении животных пользователя: {e.detail}")
+            raise e
+
+
 async def get_register_user_interactor(
         user_service: UserServiceProtocol = Depends(get_user_service),
 ) -> RegisterUserInteractor:
@@ -83,6 +144,11 @@ async def get_authenticate_user_interactor(
 ) -> AuthenticateUserInteractor:
     return AuthenticateUserInteractor(user_service=user_service)
 
+async def get_refresh_token_interactor(
+    user_service: UserServiceProtocol = Depends(get_user_service)
+) -> RefreshTokenInteractor:
+    return RefreshTokenInteractor(user_service=user_service)
+
 async def get_adopt_animal_interactor(
     user_service: UserServiceProtocol = Depends(get_user_service)
 ) -> AdoptAnimalInteractor:
@@ -91,4 +157,19 @@ async def get_adopt_animal_interactor(
 async def get_release_animal_interactor(
     user_service: UserServiceProtocol = Depends(get_user_service)
 ) -> ReleaseAnimalInteractor:
-    return ReleaseAnimalInteractor(user_service=user_service)
\ No newline at end of file
+    return ReleaseAnimalInteractor(user_service=user_service)
+
+async def get_user_animals_interactor(
+    user_service: UserServiceProtocol = Depends(get_user_service)
+) -> GetUserAnimalsInteractor:
+    return GetUserAnimalsInteractor(user_service=user_service)
+
+async def get_bulk_adopt_animals_interactor(
+    user_service: UserServiceProtocol = Depends(get_user_service)
+) -> BulkAdoptAnimalsInteractor:
+    return BulkAdoptAnimalsInteractor(user_service=user_service)
+
+async def get_bulk_release_animals_interactor(
+    user_service: UserServiceProtocol = Depends(get_user_service)
+) -> BulkReleaseAnimalsInteractor:
+    return BulkReleaseAnimalsInteractor(user_service=user_service)
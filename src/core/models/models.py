@@ -1,8 +1,10 @@
 from datetime import datetime
 
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import String
 from sqlalchemy import Integer
+from sqlalchemy import BigInteger
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
@@ -32,6 +34,15 @@ class User(Base):
 
 class Animal(Base):
     __tablename__ = "animal"
+    __table_args__ = (
+        Index("ix_animal_species_id", "species", "id"),
+        Index("ix_animal_master_id_id", "master_id", "id"),
+        Index("ix_animal_created_at_id", "created_at", "id"),
+        Index(
+            "ix_animal_species_trgm", "species",
+            postgresql_using="gin", postgresql_ops={"species": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     master_id: Mapped[Optional[int]] = mapped_column(ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
@@ -43,3 +54,12 @@ class Animal(Base):
     def __init__(self, species: str, age: int):
         self.species = species
         self.age = age
+
+
+class SpeciesStats(Base):
+    __tablename__ = "species_stats"
+
+    species: Mapped[str] = mapped_column(String(16), primary_key=True)
+    animal_count: Mapped[int] = mapped_column(Integer, default=0)
+    age_sum: Mapped[int] = mapped_column(BigInteger, default=0)
+    adopted_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -1,11 +1,188 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession, AsyncEngine, AsyncConnection
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.config.settings import db, DBSettings
+from src.core.utils.metrics import instrument_engine, registry
+
+
+class PoolWaitStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float):
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "wait_seconds_total": self.total_wait,
+            "wait_seconds_avg": self.total_wait / self.checkouts if self.checkouts else 0.0,
+            "wait_seconds_max": self.max_wait,
+        }
+
+
+pool_wait_stats = PoolWaitStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+
+        finally:
+            pool_wait_stats.record(time.perf_counter() - start)
+
+
+class RequestSession:
+    def __init__(self, engine: AsyncEngine, session_factory: async_sessionmaker):
+        self._engine = engine
+        self._session_factory = session_factory
+        self._connection: Optional[AsyncConnection] = None
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def checked_out(self) -> bool:
+        return self._connection is not None
+
+    async def get(self) -> AsyncSession:
+        if self._session is None:
+            self._connection = await self._engine.connect()
+            self._session = self._session_factory(bind=self._connection)
+
+        return self._session
+
+    def detach(self) -> "RequestSession":
+        detached = RequestSession(self._engine, self._session_factory)
+        detached._connection, detached._session = self._connection, self._session
+        self._connection = None
+        self._session = None
+        return detached
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+        if self._connection is not None:
+            await self._connection.close()
+
+        self._session = None
+        self._connection = None
+
+
+class Database:
+    def __init__(self, settings: DBSettings):
+        self.settings = settings
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._replica_engine: Optional[AsyncEngine] = None
+        self._replica_session_factory: Optional[async_sessionmaker] = None
 
-from src.config.settings import db
+    @property
+    def initialized(self) -> bool:
+        return self._engine is not None
 
-session_engine = create_async_engine(db.db_url, echo=False)
-async_session = async_sessionmaker(bind=session_engine, class_=AsyncSession, expire_on_commit=False)
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(
+                self.settings.db_url, echo=False, poolclass=InstrumentedPool, **self.settings.engine_options
+            )
+            instrument_engine(self._engine.sync_engine)
+
+        return self._engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False)
+
+        return self._session_factory
+
+    @property
+    def replica_session_factory(self) -> Optional[async_sessionmaker]:
+        if self._replica_session_factory is None and self.settings.replica_db_url:
+            self._replica_engine = create_async_engine(
+                self.settings.replica_db_url, echo=False, **self.settings.replica_engine_options
+            )
+            instrument_engine(self._replica_engine.sync_engine)
+            self._replica_session_factory = async_sessionmaker(
+                bind=self._replica_engine, class_=AsyncSession, expire_on_commit=False
+            )
+
+        return self._replica_session_factory
+
+    def request_session(self) -> RequestSession:
+        return RequestSession(self.engine, self.session_factory)
+
+    def replica_request_session(self) -> Optional[RequestSession]:
+        replica_session_factory = self.replica_session_factory
+        if replica_session_factory is None:
+            return None
+
+        return RequestSession(self._replica_engine, replica_session_factory)
+
+    def pool_stats(self) -> dict:
+        if not self.initialized:
+            return {}
+
+        # Лимиты берутся у самого пула, а не из глобальных настроек: у этого экземпляра они могут быть другими
+        pool = self._engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            **pool_wait_stats.as_dict(),
+        }
+
+    async def warm_up(self, connections: int):
+        from src.core.repositories.animals_repository import AnimalsRepository
+        from src.core.repositories.user_repository import UserRepository
+
+        async def prepare_connection():
+            async with self.engine.connect() as connection:
+                async with AsyncSession(bind=connection) as session:
+                    animals = AnimalsRepository(session)
+                    await animals.find_one(inst_id=0)
+                    await animals.find_many(inst_ids=[0])
+                    await animals.get_animals_by_species(species="", limit=0)
+                    await UserRepository(session).get_user_by_username("")
+
+        await asyncio.gather(*(prepare_connection() for _ in range(connections)))
+
+    async def dispose(self):
+        if self._engine is not None:
+            await self._engine.dispose()
+
+        if self._replica_engine is not None:
+            await self._replica_engine.dispose()
+
+        self._engine = None
+        self._session_factory = None
+        self._replica_engine = None
+        self._replica_session_factory = None
+
+
+database = Database(db)
 
 async def get_async_session():
-    async with async_session() as session:
-        yield session
\ No newline at end of file
+    async with database.session_factory() as session:
+        yield session
+
+def get_pool_stats() -> dict:
+    return database.pool_stats()
+
+
+registry.gauges("db_pool", "Состояние пула соединений", get_pool_stats)
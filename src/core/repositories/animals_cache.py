@@ -0,0 +1,96 @@
+from typing import Awaitable, Callable, Dict, Optional
+
+from src.config.settings import settings
+from src.core.dtos.zoo_dto import AnimalSchema
+from src.core.models.models import Animal
+from src.core.utils.cache import CacheBackendError, CacheBackendProtocol, CacheStats, get_cache_backend
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AnimalCache:
+    def __init__(self, backend: CacheBackendProtocol, ttl_seconds: float):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        # Поколения ведутся только для id, которые сейчас загружаются: invalidate увеличивает
+        # поколение, и загрузка, начатая до него, не перезаписывает кеш устаревшими данными
+        self._loads: Dict[int, int] = {}
+        self._generations: Dict[int, int] = {}
+
+    @staticmethod
+    def _key(animal_id: int) -> str:
+        return f"animal:{animal_id}"
+
+    async def get_or_load(self, animal_id: int,
+                          loader: Callable[[], Awaitable[Optional[Animal]]]) -> Optional[AnimalSchema]:
+        try:
+            cached = await self.backend.get(self._key(animal_id))
+
+        except CacheBackendError as e:
+            logger.warning(f"Ошибка чтения кеша животных: {str(e)}")
+            self.stats.errors += 1
+            cached = None
+
+        if cached is not None:
+            self.stats.hits += 1
+            return AnimalSchema.model_validate_json(cached)
+
+        self.stats.misses += 1
+        generation = self._begin_load(animal_id)
+        try:
+            animal = await loader()
+
+        finally:
+            fresh = self._end_load(animal_id, generation)
+
+        if animal is None:
+            return None
+
+        animal_schema = AnimalSchema.model_validate(animal)
+
+        if not fresh:
+            return animal_schema
+
+        try:
+            await self.backend.set(self._key(animal_id), animal_schema.model_dump_json().encode(), self.ttl_seconds)
+
+        except CacheBackendError as e:
+            logger.warning(f"Ошибка записи в кеш животных: {str(e)}")
+            self.stats.errors += 1
+
+        return animal_schema
+
+    async def invalidate(self, *animal_ids: int):
+        for animal_id in animal_ids:
+            if animal_id in self._generations:
+                self._generations[animal_id] += 1
+
+        try:
+            await self.backend.delete(*(self._key(animal_id) for animal_id in animal_ids))
+
+        except CacheBackendError as e:
+            logger.warning(f"Ошибка инвалидации кеша животных: {str(e)}")
+            self.stats.errors += 1
+
+    def generation(self, animal_id: int) -> int:
+        return self._generations.get(animal_id, 0)
+
+    def _begin_load(self, animal_id: int) -> int:
+        self._loads[animal_id] = self._loads.get(animal_id, 0) + 1
+        return self._generations.setdefault(animal_id, 0)
+
+    def _end_load(self, animal_id: int, generation: int) -> bool:
+        fresh = self._generations[animal_id] == generation
+        self._loads[animal_id] -= 1
+
+        if not self._loads[animal_id]:
+            del self._loads[animal_id]
+            del self._generations[animal_id]
+
+        return fresh
+
+
+animal_cache = AnimalCache(backend=get_cache_backend(), ttl_seconds=settings.ANIMAL_CACHE_TTL_SECONDS)
@@ -1,9 +1,11 @@
-from typing import Protocol, Optional, Annotated, List
+from datetime import datetime
+from typing import Protocol, Optional, Annotated, List, Tuple, AsyncIterator, Sequence
 
 from fastapi import Depends
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, bindparam, func
+from sqlalchemy.engine import Row
 
 from src.core.dtos.zoo_dto import CreateAnimal, AnimalSchema
 from src.core.models.session_factory import get_async_session
@@ -12,17 +14,129 @@ from src.core.models.models import Animal
 
 
 class AnimalsRepositoryProtocol(Protocol):
-    async def get_animals_by_species(self, species: str):
+    async def find_many(self, inst_ids: List[int]) -> List[Animal]:
+        ...
+
+    async def add_many(self, data: List[dict], batch_size: int) -> List[Animal]:
+        ...
+
+    async def copy_many(self, data: List[dict], columns: Tuple[str, ...]) -> List[dict]:
+        ...
+
+    async def get_animals_by_species(self, species: str, limit: int, cursor: Optional[str] = None,
+                                     order_by: str = "id") -> Tuple[List[Animal], Optional[str]]:
+        ...
+
+    async def search_by_species(self, query: str, match: str, limit: int,
+                                cursor: Optional[str] = None) -> Tuple[List[Animal], Optional[str]]:
+        ...
+
+    async def get_animals_by_owner(self, owner_id: int, limit: int, cursor: Optional[str] = None,
+                                   order_by: str = "id") -> Tuple[List[Animal], Optional[str]]:
+        ...
+
+    async def count_by_owner(self, owner_id: int) -> int:
+        ...
+
+    def stream_export(self, chunk_size: int, species: Optional[str] = None, owner_id: Optional[int] = None,
+                      created_from: Optional[datetime] = None,
+                      created_to: Optional[datetime] = None) -> AsyncIterator[Sequence[Row]]:
+        ...
+
+    async def edit_one_with_previous(self, data: dict, inst_id: int) -> Optional[Row]:
+        ...
+
+    async def delete_one_returning(self, inst_id: int) -> Optional[Row]:
         ...
 
 
 class AnimalsRepository(SQLAlchemyRepository):
     model = Animal
 
-    async def get_animals_by_species(self, species: str):
-        result = await self.session.execute(select(Animal).where(Animal.species == species))
-        animals = result.scalars().all()
-        return animals
+    async def get_animals_by_species(self, species: str, limit: int, cursor: Optional[str] = None,
+                                     order_by: str = "id") -> Tuple[List[Animal], Optional[str]]:
+        self._check_order_by(order_by)
+        stmt = self._cached_statement(
+            ("species_page", order_by, bool(cursor)),
+            lambda: self._page_statement(order_by, bool(cursor), (Animal.species == bindparam("species"),)),
+        )
+        return await self._execute_page(stmt, limit, cursor, order_by, {"species": species})
+
+    async def get_animals_by_owner(self, owner_id: int, limit: int, cursor: Optional[str] = None,
+                                   order_by: str = "id") -> Tuple[List[Animal], Optional[str]]:
+        self._check_order_by(order_by)
+        stmt = self._cached_statement(
+            ("owner_page", order_by, bool(cursor)),
+            lambda: self._page_statement(order_by, bool(cursor), (Animal.master_id == bindparam("owner_id"),)),
+        )
+        return await self._execute_page(stmt, limit, cursor, order_by, {"owner_id": owner_id})
+
+    async def count_by_owner(self, owner_id: int) -> int:
+        stmt = self._cached_statement(
+            "count_by_owner",
+            lambda: select(func.count()).select_from(Animal).where(Animal.master_id == bindparam("owner_id")),
+        )
+        res = await self.session.execute(stmt, {"owner_id": owner_id})
+        return res.scalar_one()
+
+    async def search_by_species(self, query: str, match: str, limit: int,
+                                cursor: Optional[str] = None) -> Tuple[List[Animal], Optional[str]]:
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"{escaped}%" if match == "prefix" else f"%{escaped}%"
+
+        return await self.find_page(limit=limit, cursor=cursor,
+                                    filters=(Animal.species.ilike(pattern, escape="\\"),))
+
+    async def stream_export(self, chunk_size: int, species: Optional[str] = None, owner_id: Optional[int] = None,
+                            created_from: Optional[datetime] = None,
+                            created_to: Optional[datetime] = None) -> AsyncIterator[Sequence[Row]]:
+        stmt = select(Animal.id, Animal.species, Animal.age, Animal.master_id, Animal.created_at)
+
+        if species is not None:
+            stmt = stmt.where(Animal.species == species)
+
+        if owner_id is not None:
+            stmt = stmt.where(Animal.master_id == owner_id)
+
+        if created_from is not None:
+            stmt = stmt.where(Animal.created_at >= created_from)
+
+        if created_to is not None:
+            stmt = stmt.where(Animal.created_at < created_to)
+
+        result = await self.session.stream(stmt.order_by(Animal.id).execution_options(yield_per=chunk_size))
+        async for partition in result.partitions():
+            yield partition
+
+    async def edit_one_with_previous(self, data: dict, inst_id: int) -> Optional[Row]:
+        previous = (
+            select(Animal.id, Animal.species, Animal.age)
+            .where(Animal.id == inst_id)
+            .with_for_update()
+            .subquery("previous")
+        )
+        stmt = (
+            update(Animal)
+            .where(Animal.id == previous.c.id)
+            .values(**data)
+            .returning(
+                Animal.id, Animal.species, Animal.age, Animal.master_id,
+                previous.c.species.label("previous_species"), previous.c.age.label("previous_age"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
+
+    async def delete_one_returning(self, inst_id: int) -> Optional[Row]:
+        stmt = (
+            delete(Animal)
+            .where(Animal.id == inst_id)
+            .returning(Animal.id, Animal.species, Animal.age, Animal.master_id)
+            .execution_options(synchronize_session=False)
+        )
+        res = await self.session.execute(stmt)
+        return res.one_or_none()
 
 async def get_animals_repository(session: AsyncSession = Depends(get_async_session)) -> AnimalsRepositoryProtocol:
     return AnimalsRepository(session=session)
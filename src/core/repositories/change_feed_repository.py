@@ -0,0 +1,25 @@
+from typing import List, Protocol
+
+from sqlalchemy import Text, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.core.dtos.zoo_dto import AnimalChangeEvent
+from src.core.repositories.repository import SQLAlchemyRepository
+from src.core.utils.change_feed import CHANNEL
+
+
+class ChangeFeedRepositoryProtocol(Protocol):
+    async def publish(self, events: List[AnimalChangeEvent]):
+        ...
+
+
+class ChangeFeedRepository(SQLAlchemyRepository):
+    async def publish(self, events: List[AnimalChangeEvent]):
+        if not events:
+            return
+
+        stmt = self._cached_statement(
+            "publish",
+            lambda: select(func.pg_notify(CHANNEL, func.unnest(bindparam("payloads", type_=ARRAY(Text))))),
+        )
+        await self.session.execute(stmt, {"payloads": [event.model_dump_json() for event in events]})
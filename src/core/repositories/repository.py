@@ -1,68 +1,194 @@
-from typing import Protocol, Dict, List, Optional, TypeVar, Generic, Any, Annotated
+from typing import Protocol, Dict, List, Optional, TypeVar, Generic, Any, Annotated, Sequence, Tuple, Callable, Hashable
 
 from fastapi import Depends
-from sqlalchemy import insert, select, update, delete
+from sqlalchemy import insert, select, update, delete, tuple_, func, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
 
 from src.core.models.session_factory import get_async_session
 from src.core.repositories.uow import UnitOfWork
+from src.core.utils.metrics import tag_repository_methods
+from src.core.utils.pagination import ORDER_FIELDS, clamp_page_size, encode_cursor, decode_cursor
 
 T = TypeVar("T")
 
+_statement_cache: Dict[Tuple[Any, Hashable], Executable] = {}
+
+# asyncpg передаёт номер параметра как int16, поэтому в одном запросе их не больше 32767
+MAX_BIND_PARAMS = 32767
+
 class AbstractRepository(Protocol[T]):
     async def add_one(self, data: dict) -> T:
         ...
 
-    async def edit_one(self, data: dict, inst_id: int) -> T:
+    async def add_many(self, data: List[dict], batch_size: int) -> List[T]:
+        ...
+
+    async def copy_many(self, data: List[dict], columns: Sequence[str]) -> List[dict]:
+        ...
+
+    async def edit_one(self, data: dict, inst_id: int) -> Optional[T]:
         ...
 
     async def find_all(self) -> List[T]:
         ...
 
+    async def find_page(self, limit: int, cursor: Optional[str] = None, order_by: str = "id",
+                        filters: Sequence[Any] = ()) -> Tuple[List[T], Optional[str]]:
+        ...
+
     async def find_one(self, inst_id: int) -> Optional[T]:
         ...
 
+    async def find_many(self, inst_ids: List[int]) -> List[T]:
+        ...
+
     async def delete_one(self, inst_id: int) -> bool:
         ...
 
+@tag_repository_methods
 class SQLAlchemyRepository:
     model = None
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        tag_repository_methods(cls)
+
     async def add_one(self, data: dict) -> T:
         stmt = insert(self.model).values(**data).returning(self.model)
         res = await self.session.execute(stmt)
         return res.scalar_one()
 
-    async def edit_one(self, data: dict, inst_id: int) -> T:
-        stmt = update(self.model).values(**data).where(self.model.id == inst_id)
-        res = await self.session.execute(stmt)
+    async def add_many(self, data: List[dict], batch_size: int) -> List[T]:
+        created = []
+        if data:
+            batch_size = max(1, min(batch_size, MAX_BIND_PARAMS // len(data[0])))
+
+        for start in range(0, len(data), batch_size):
+            stmt = insert(self.model).values(data[start:start + batch_size]).returning(self.model)
+            res = await self.session.execute(stmt)
+            created.extend(res.scalars().all())
+
+        return created
+
+    async def copy_many(self, data: List[dict], columns: Sequence[str]) -> List[dict]:
+        table = self.model.__table__
+        connection = await self.session.connection()
+        table_name = connection.dialect.identifier_preparer.format_table(table)
+
+        ids_stmt = select(func.nextval(func.pg_get_serial_sequence(table_name, "id"))).select_from(
+            func.generate_series(1, len(data))
+        )
+        ids = (await self.session.execute(ids_stmt)).scalars().all()
+
+        rows = [{"id": inst_id, **row} for inst_id, row in zip(ids, data)]
+        all_columns = ["id", *columns]
+
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(row[column] for column in all_columns) for row in rows],
+            columns=all_columns,
+        )
+
+        return rows
 
-        stmt = select(self.model).where(self.model.id == inst_id)
+    async def edit_one(self, data: dict, inst_id: int) -> Optional[T]:
+        stmt = update(self.model).values(**data).where(self.model.id == inst_id).returning(self.model)
         res = await self.session.execute(stmt)
-        return res.scalar_one()
+        return res.scalar_one_or_none()
 
     async def find_all(self) -> List[T]:
         stmt = select(self.model)
         res = await self.session.execute(stmt)
         return res.scalars().all()
 
+    async def find_page(self, limit: int, cursor: Optional[str] = None, order_by: str = "id",
+                        filters: Sequence[Any] = ()) -> Tuple[List[T], Optional[str]]:
+        self._check_order_by(order_by)
+        stmt = self._page_statement(order_by, bool(cursor), filters)
+        return await self._execute_page(stmt, limit, cursor, order_by)
+
     async def find_one(self, inst_id: int) -> Optional[T]:
-        stmt = select(self.model).where(self.model.id == inst_id)
-        res = await self.session.execute(stmt)
+        stmt = self._cached_statement(
+            "find_one", lambda: select(self.model).where(self.model.id == bindparam("inst_id", type_=Integer))
+        )
+        res = await self.session.execute(stmt, {"inst_id": inst_id})
         return res.scalars().one_or_none()
 
+    async def find_many(self, inst_ids: List[int]) -> List[T]:
+        ids = bindparam("inst_ids", inst_ids, type_=ARRAY(Integer))
+        stmt = select(self.model).where(self.model.id == any_(ids))
+        res = await self.session.execute(stmt)
+        return list(res.scalars().all())
+
     async def delete_one(self, inst_id: int) -> bool:
-        stmt = delete(self.model).where(self.model.id == inst_id)
+        stmt = delete(self.model).where(self.model.id == inst_id).returning(self.model.id)
         result = await self.session.execute(stmt)
 
-        if result.rowcount == 0:
+        if result.scalar_one_or_none() is None:
             raise ValueError("Объект не найден")
 
         return True
 
+    @classmethod
+    def _cached_statement(cls, key: Hashable, build: Callable[[], Executable]) -> Executable:
+        cache_key = (cls.model, key)
+        stmt = _statement_cache.get(cache_key)
+
+        if stmt is None:
+            stmt = _statement_cache[cache_key] = build()
+
+        return stmt
+
+    @staticmethod
+    def _check_order_by(order_by: str):
+        if order_by not in ORDER_FIELDS:
+            raise ValueError(f"Нельзя сортировать по полю {order_by}")
+
+    def _page_statement(self, order_by: str, with_cursor: bool, filters: Sequence[Any] = ()) -> Executable:
+        stmt = select(self.model).where(*filters)
+
+        if order_by == "created_at":
+            stmt = stmt.order_by(self.model.created_at, self.model.id)
+            if with_cursor:
+                last_created_at = bindparam("last_created_at", type_=self.model.created_at.type)
+                last_id = bindparam("last_id", type_=Integer)
+                stmt = stmt.where(tuple_(self.model.created_at, self.model.id) > tuple_(last_created_at, last_id))
+
+        else:
+            stmt = stmt.order_by(self.model.id)
+            if with_cursor:
+                stmt = stmt.where(self.model.id > bindparam("last_id", type_=Integer))
+
+        return stmt.limit(bindparam("page_limit", type_=Integer))
+
+    async def _execute_page(self, stmt: Executable, limit: int, cursor: Optional[str], order_by: str,
+                            params: Optional[dict] = None) -> Tuple[List[T], Optional[str]]:
+        limit = clamp_page_size(limit)
+        params = {**(params or {}), "page_limit": limit + 1}
+
+        if cursor:
+            position = decode_cursor(cursor, order_by)
+            params["last_id"] = position["id"]
+            if order_by == "created_at":
+                params["last_created_at"] = position["c"]
+
+        res = await self.session.execute(stmt, params)
+        items = list(res.scalars().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(order_by, last.id, getattr(last, "created_at", None))
+
+        return items, next_cursor
+
 async def get_sql_rep(session: AsyncSession = Depends(get_async_session)) -> AbstractRepository:
     return SQLAlchemyRepository(session=session)
 
@@ -0,0 +1,86 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Protocol
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.core.models.models import Animal, SpeciesStats
+from src.core.repositories.repository import SQLAlchemyRepository
+
+
+class SpeciesStatsDelta:
+    def __init__(self):
+        self._deltas: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def add(self, species: str, count: int = 0, age: int = 0, adopted: int = 0) -> "SpeciesStatsDelta":
+        delta = self._deltas[species]
+        delta[0] += count
+        delta[1] += age
+        delta[2] += adopted
+        return self
+
+    def animal_added(self, species: str, age: int, master_id: Optional[int] = None) -> "SpeciesStatsDelta":
+        return self.add(species, 1, age, int(master_id is not None))
+
+    def animal_removed(self, species: str, age: int, master_id: Optional[int] = None) -> "SpeciesStatsDelta":
+        return self.add(species, -1, -age, -int(master_id is not None))
+
+    def rows(self) -> List[dict]:
+        return [
+            {"species": species, "animal_count": count, "age_sum": age, "adopted_count": adopted}
+            for species, (count, age, adopted) in sorted(self._deltas.items())
+            if count or age or adopted
+        ]
+
+
+class SpeciesStatsRepositoryProtocol(Protocol):
+    async def apply(self, delta: SpeciesStatsDelta):
+        ...
+
+    async def find_all(self) -> List[SpeciesStats]:
+        ...
+
+    async def rebuild(self):
+        ...
+
+
+class SpeciesStatsRepository(SQLAlchemyRepository):
+    model = SpeciesStats
+
+    async def apply(self, delta: SpeciesStatsDelta):
+        rows = delta.rows()
+        if not rows:
+            return
+
+        stmt = pg_insert(SpeciesStats).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SpeciesStats.species],
+            set_={
+                "animal_count": SpeciesStats.animal_count + stmt.excluded.animal_count,
+                "age_sum": SpeciesStats.age_sum + stmt.excluded.age_sum,
+                "adopted_count": SpeciesStats.adopted_count + stmt.excluded.adopted_count,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def find_all(self) -> List[SpeciesStats]:
+        stmt = select(SpeciesStats).where(SpeciesStats.animal_count > 0).order_by(SpeciesStats.species)
+        res = await self.session.execute(stmt)
+        return list(res.scalars().all())
+
+    async def rebuild(self):
+        await self.session.execute(text("LOCK TABLE animal IN SHARE MODE"))
+        await self.session.execute(delete(SpeciesStats))
+
+        aggregated = select(
+            Animal.species,
+            func.count(),
+            func.coalesce(func.sum(Animal.age), 0),
+            func.count(Animal.master_id),
+        ).group_by(Animal.species)
+
+        await self.session.execute(
+            insert(SpeciesStats).from_select(
+                ["species", "animal_count", "age_sum", "adopted_count"], aggregated
+            )
+        )
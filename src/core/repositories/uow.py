@@ -1,19 +1,35 @@
+import time
 from typing import Protocol, Type, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
-from src.core.models.session_factory import async_session
+from src.config.settings import db
+from src.core.models.session_factory import RequestSession, database
 
 from typing import TYPE_CHECKING
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 if TYPE_CHECKING:
     from src.core.repositories.user_repository import UserRepositoryProtocol, UserRepository
     from src.core.repositories.animals_repository import AnimalsRepositoryProtocol, AnimalsRepository
+    from src.core.repositories.species_stats_repository import SpeciesStatsRepositoryProtocol
+    from src.core.repositories.change_feed_repository import ChangeFeedRepositoryProtocol
 
 class IUnitOfWork(Protocol):
     users: "UserRepositoryProtocol"
     animals: "AnimalsRepositoryProtocol"
+    species_stats: "SpeciesStatsRepositoryProtocol"
+    changes: "ChangeFeedRepositoryProtocol"
+
+    def read_only(self, consistent: bool = False) -> "IUnitOfWork":
+        ...
+
+    def detach(self) -> "IUnitOfWork":
+        ...
 
     async def __aenter__(self):
         ...
@@ -27,29 +43,117 @@ class IUnitOfWork(Protocol):
     async def rollback(self):
         ...
 
+    async def close(self):
+        ...
+
+
+class ReplicaRouting:
+    def __init__(self, retry_seconds: float, sticky_seconds: float):
+        self.retry_seconds = retry_seconds
+        self.sticky_seconds = sticky_seconds
+        self._unavailable_until = 0.0
+        self._last_write_at = 0.0
+
+    def mark_write(self):
+        self._last_write_at = time.monotonic()
+
+    def mark_unavailable(self):
+        self._unavailable_until = time.monotonic() + self.retry_seconds
+
+    def should_use_replica(self, consistent: bool) -> bool:
+        if consistent:
+            return False
+
+        now = time.monotonic()
+        if now < self._unavailable_until:
+            return False
+
+        return now - self._last_write_at >= self.sticky_seconds
+
+
+replica_routing = ReplicaRouting(retry_seconds=db.replica_retry_seconds, sticky_seconds=db.replica_sticky_seconds)
+
+
 class UnitOfWork:
-    def __init__(self, session: AsyncSession):
-        self.session: AsyncSession = session
+    def __init__(self, session: RequestSession, replica_session: Optional[RequestSession] = None):
+        self.session: RequestSession = session
+        self.replica_session: Optional[RequestSession] = replica_session
+        self._active_session: Optional[AsyncSession] = None
+        self._on_replica = False
+        self._read_only = False
+        self._consistent = False
+
+    def read_only(self, consistent: bool = False) -> "UnitOfWork":
+        self._read_only = True
+        self._consistent = consistent
+        return self
+
+    def detach(self) -> "UnitOfWork":
+        # Уже взятые соединения переходят новому UnitOfWork, этот при следующем обращении возьмёт свои
+        replica_session = self.replica_session.detach() if self.replica_session is not None else None
+        return UnitOfWork(self.session.detach(), replica_session)
 
     async def __aenter__(self):
         from src.core.repositories.animals_repository import AnimalsRepositoryProtocol, AnimalsRepository
         from src.core.repositories.user_repository import UserRepositoryProtocol, UserRepository
-        self.users = UserRepository(self.session)
-        self.animals = AnimalsRepository(self.session)
+        from src.core.repositories.species_stats_repository import SpeciesStatsRepository
+        from src.core.repositories.change_feed_repository import ChangeFeedRepository
+        self._on_replica = False
+        self._active_session = await self._select_session()
+        self.users = UserRepository(self._active_session)
+        self.animals = AnimalsRepository(self._active_session)
+        self.species_stats = SpeciesStatsRepository(self._active_session)
+        self.changes = ChangeFeedRepository(self._active_session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
-            await self.session.rollback()
+            await self._active_session.rollback()
 
-        await self.session.close()
+        self._read_only = False
+        self._consistent = False
 
     async def commit(self):
-        await self.session.commit()
+        await self._active_session.commit()
+
+        if not self._on_replica:
+            replica_routing.mark_write()
 
     async def rollback(self):
-        await self.session.rollback()
+        await self._active_session.rollback()
+
+    async def close(self):
+        await self.session.close()
+
+        if self.replica_session is not None:
+            await self.replica_session.close()
+
+    async def _select_session(self) -> AsyncSession:
+        if not self._read_only or self.replica_session is None:
+            return await self.session.get()
+
+        if not replica_routing.should_use_replica(self._consistent):
+            return await self.session.get()
+
+        try:
+            replica_session = await self.replica_session.get()
+            await replica_session.connection()
+            self._on_replica = True
+            return replica_session
+
+        except Exception as e:
+            logger.warning(f"Реплика недоступна, чтение идёт с основной базы: {str(e)}")
+            replica_routing.mark_unavailable()
+            await self.replica_session.close()
+            return await self.session.get()
+
+def create_uow() -> UnitOfWork:
+    return UnitOfWork(database.request_session(), database.replica_request_session())
 
 async def get_uow() -> UnitOfWork:
-    async with async_session() as session:
-        yield UnitOfWork(session)
\ No newline at end of file
+    uow = create_uow()
+    try:
+        yield uow
+
+    finally:
+        await uow.close()
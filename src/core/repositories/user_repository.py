@@ -1,10 +1,11 @@
-from typing import Protocol, Optional, Annotated
+from typing import Protocol, Optional, Annotated, List
 
 from fastapi.params import Depends, Header
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, bindparam, func, any_, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
 
 from src.core.dtos.auth_dto import TokenResponse
 from src.core.models.models import User, Animal
@@ -16,10 +17,16 @@ class UserRepositoryProtocol(Protocol):
     async def get_user_by_username(self, username: str) ->  User:
         ...
 
-    async def adopt_animal(self, user_id: int, animal_id):
+    async def adopt_animal(self, user_id: int, animal_id: int) -> Row:
         ...
 
-    async def release_animal(self, user_id: int, animal_id: int):
+    async def release_animal(self, user_id: int, animal_id: int) -> Row:
+        ...
+
+    async def adopt_animals(self, user_id: int, animal_ids: List[int]) -> List[Row]:
+        ...
+
+    async def release_animals(self, user_id: int, animal_ids: List[int]) -> List[Row]:
         ...
 
 class TokenGeneratorProtocol(Protocol):
@@ -36,43 +43,123 @@ class UserRepository(SQLAlchemyRepository):
     model = User
 
     async def get_user_by_username(self, username: str) -> User:
-        result = await self.session.execute(select(User).where(User.username == username))
+        stmt = self._cached_statement(
+            "get_user_by_username", lambda: select(User).where(User.username == bindparam("username"))
+        )
+        result = await self.session.execute(stmt, {"username": username})
         user = result.scalars().first()
         return user
 
-    async def adopt_animal(self, user_id: int, animal_id: int):
-        user = await self.session.execute(select(User).where(User.id == user_id).options(selectinload(User.animals)))
-        user = user.scalars().first()
-
-        animal = await self.session.execute(select(Animal).where(Animal.id == animal_id))
-        animal = animal.scalars().first()
-
-        if not user or not animal:
+    async def adopt_animal(self, user_id: int, animal_id: int) -> Row:
+        user_exists = select(User.id).where(User.id == user_id).exists()
+        stmt = (
+            update(Animal)
+            .where(Animal.id == animal_id, Animal.master_id.is_(None), user_exists)
+            .values(master_id=user_id)
+            .returning(*self._ownership_columns(user_id))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            await self._raise_ownership_error(user_id, animal_id, adopting=True)
+
+        return row
+
+    async def release_animal(self, user_id: int, animal_id: int) -> Row:
+        stmt = (
+            update(Animal)
+            .where(Animal.id == animal_id, Animal.master_id == user_id)
+            .values(master_id=None)
+            .returning(*self._ownership_columns(user_id))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            await self._raise_ownership_error(user_id, animal_id, adopting=False)
+
+        return row
+
+    async def adopt_animals(self, user_id: int, animal_ids: List[int]) -> List[Row]:
+        stmt = self._cached_statement(("bulk_ownership", True), lambda: self._bulk_ownership_statement(adopting=True))
+        result = await self.session.execute(stmt, {"user_id": user_id, "animal_ids": animal_ids})
+        return list(result.all())
+
+    async def release_animals(self, user_id: int, animal_ids: List[int]) -> List[Row]:
+        stmt = self._cached_statement(("bulk_ownership", False), lambda: self._bulk_ownership_statement(adopting=False))
+        result = await self.session.execute(stmt, {"user_id": user_id, "animal_ids": animal_ids})
+        return list(result.all())
+
+    @staticmethod
+    def _bulk_ownership_statement(adopting: bool):
+        animal = Animal.__table__
+        user_id = bindparam("user_id", type_=Integer)
+        animal_ids = bindparam("animal_ids", type_=ARRAY(Integer))
+
+        requested = select(func.unnest(animal_ids).label("id")).cte("requested")
+        username = select(User.username).where(User.id == user_id).scalar_subquery()
+
+        if adopting:
+            changed = (
+                update(animal)
+                .where(animal.c.id == any_(animal_ids), animal.c.master_id.is_(None), username.is_not(None))
+                .values(master_id=user_id)
+            )
+        else:
+            changed = (
+                update(animal)
+                .where(animal.c.id == any_(animal_ids), animal.c.master_id == user_id)
+                .values(master_id=None)
+            )
+
+        changed = changed.returning(animal.c.id, animal.c.species, animal.c.age).cte("changed")
+        previous = animal.alias("previous")
+
+        return (
+            select(
+                requested.c.id,
+                changed.c.id.is_not(None).label("changed"),
+                # Вид и возраст изменённых строк берутся из RETURNING: снимок previous
+                # может не увидеть параллельное изменение вида, дождавшееся блокировки в UPDATE
+                changed.c.species.label("changed_species"),
+                changed.c.age.label("changed_age"),
+                previous.c.id.is_not(None).label("found"),
+                previous.c.master_id.label("previous_master_id"),
+                previous.c.species,
+                previous.c.age,
+                previous.c.created_at,
+                username.label("username"),
+            )
+            .select_from(
+                requested
+                .outerjoin(changed, changed.c.id == requested.c.id)
+                .outerjoin(previous, previous.c.id == requested.c.id)
+            )
+        )
+
+    @staticmethod
+    def _ownership_columns(user_id: int):
+        username = select(User.username).where(User.id == user_id).scalar_subquery()
+        return (Animal.id, Animal.species, Animal.age, Animal.created_at, Animal.master_id, username.label("username"))
+
+    async def _raise_ownership_error(self, user_id: int, animal_id: int, adopting: bool):
+        user = await self.session.execute(select(User.id).where(User.id == user_id))
+        animal = await self.session.execute(select(Animal.master_id).where(Animal.id == animal_id))
+        animal_row = animal.one_or_none()
+
+        if user.scalar_one_or_none() is None or animal_row is None:
             raise ValueError("Не удалось найти ни животное ни человека")
 
-        if animal not in user.animals:
-            user.animals.append(animal)
-
-        else:
+        if adopting and animal_row.master_id == user_id:
             raise ValueError("Нельзя дважды добавить к себе одно и то же животное")
 
-        return user
-
-    async def release_animal(self, user_id: int, animal_id: int):
-        user = await self.session.execute(select(User).where(User.id == user_id).options(selectinload(User.animals)))
-        user = user.scalars().first()
-
-        animal = await self.session.execute(select(Animal).where(Animal.id == animal_id))
-        animal = animal.scalars().first()
+        if adopting:
+            raise ValueError("Животное уже приручено другим пользователем")
 
-        if not user or not animal:
-            raise ValueError("Не удалось найти ни животное ни человека")
-
-        if animal not in user.animals:
-            raise ValueError("Нельзя удалить у пользователя животное, которого у него нету")
-
-        user.animals.remove(animal)
-        return user
+        raise ValueError("Нельзя удалить у пользователя животное, которого у него нету")
 
 async def get_user_repository(session: AsyncSession = Depends(get_async_session)) -> UserRepositoryProtocol:
     return UserRepository(session=session)
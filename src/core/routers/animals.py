@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
-from src.core.dtos.user_dto import UserSchema
+from src.core.dtos.user_dto import UserResponse
 from src.core.dtos.zoo_dto import *
 from src.core.interactors.animals_interactors import *
+from src.core.repositories.uow import IUnitOfWork, get_uow
 from src.core.services.users_service import get_user_service, get_current_user_dependency
+from src.core.utils.change_feed import change_feed
+from src.config.settings import settings
+from src.core.utils.serialization import EXPORT_MEDIA_TYPES, json_list_response, json_response, species_stats_adapter
 
 animal_router = APIRouter(prefix="/animals", tags=["animals"])
 
@@ -11,11 +16,31 @@ animal_router = APIRouter(prefix="/animals", tags=["animals"])
 async def create_animal(
         animal_data: CreateAnimal,
         create_animal_interactor: CreateAnimalInteractor = Depends(get_create_animal_interactor),
-        current_user: UserSchema = Depends(get_current_user_dependency)
+        current_user: UserResponse = Depends(get_current_user_dependency)
 ):
     try:
         animal = await create_animal_interactor.execute(animal_data)
-        return animal
+        return json_response(animal)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера"
+        )
+
+
+@animal_router.post("/bulk_create", response_model=BulkCreateAnimalsResponse)
+async def bulk_create_animals(
+        animals_data: List[Any] = Body(..., max_length=settings.BULK_CREATE_MAX_ROWS),
+        bulk_create_animals_interactor: BulkCreateAnimalsInteractor = Depends(get_bulk_create_animals_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        result = await bulk_create_animals_interactor.execute(animals_data)
+        return json_response(result)
 
     except HTTPException as e:
         raise e
@@ -31,12 +56,12 @@ async def create_animal(
 async def update_animal(
         animal_data: UpdateAnimalRequest,
         update_animal_interactor: UpdateAnimalInteractor = Depends(get_update_animal_interactor),
-        current_user: UserSchema = Depends(get_current_user_dependency)
+        current_user: UserResponse = Depends(get_current_user_dependency)
 ):
     try:
         animal = await update_animal_interactor.execute(animal_data)
 
-        return animal
+        return json_response(animal)
 
     except HTTPException as e:
         raise e
@@ -51,12 +76,12 @@ async def update_animal(
 async def get_animal_by_id(
         id: int,
         get_animal_by_id_interactor: GetAnimalByIdInteractor = Depends(get_animal_by_id_interactor),
-        current_user: UserSchema = Depends(get_current_user_dependency)
+        current_user: UserResponse = Depends(get_current_user_dependency)
 ):
     try:
         animal = await get_animal_by_id_interactor.execute(id)
 
-        return animal
+        return json_response(animal)
 
     except HTTPException as e:
         raise e
@@ -67,16 +92,58 @@ async def get_animal_by_id(
             detail="Произошла внутренняя ошибка сервера"
         )
 
-@animal_router.get("/get_animals_by_species", response_model=Optional[List[AnimalSchema]])
+@animal_router.get("/get_animals_by_ids", response_model=AnimalsByIdsResponse)
+async def get_animals_by_ids(
+        ids: List[int] = Query(..., min_length=1, max_length=settings.BATCH_LOOKUP_MAX_IDS),
+        get_animals_by_ids_interactor: GetAnimalsByIdsInteractor = Depends(get_animals_by_ids_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        animals = await get_animals_by_ids_interactor.execute(ids)
+
+        return json_response(animals)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
+
+@animal_router.get("/get_animals_by_species", response_model=AnimalPage)
 async def get_animals_by_species(
         species: str,
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        cursor: Optional[str] = None,
+        order_by: AnimalOrder = "id",
         get_animals_by_species_interactor: GetAnimalsBySpeciesInteractor = Depends(get_animals_by_species_interactor),
-        current_user: UserSchema = Depends(get_current_user_dependency)
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        animals = await get_animals_by_species_interactor.execute(species, limit, cursor, order_by)
+
+        return json_response(animals)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
+
+@animal_router.get("/stats/species", response_model=List[SpeciesStatsSchema])
+async def get_species_stats(
+        get_species_stats_interactor: GetSpeciesStatsInteractor = Depends(get_species_stats_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
 ):
     try:
-        animals = await get_animals_by_species_interactor.execute(species)
+        stats = await get_species_stats_interactor.execute()
 
-        return animals
+        return json_list_response(species_stats_adapter, stats)
 
     except HTTPException as e:
         raise e
@@ -87,11 +154,98 @@ async def get_animals_by_species(
             detail="Произошла внутренняя ошибка сервера",
         )
 
+@animal_router.get("/search", response_model=AnimalPage)
+async def search_animals(
+        query: str,
+        match: SpeciesMatch = "prefix",
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        cursor: Optional[str] = None,
+        search_animals_interactor: SearchAnimalsInteractor = Depends(get_search_animals_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        animals = await search_animals_interactor.execute(query, match, limit, cursor)
+
+        return json_response(animals)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
+
+@animal_router.get("/species/autocomplete", response_model=SpeciesSuggestions)
+async def autocomplete_species(
+        prefix: str = "",
+        limit: int = Query(10, ge=1, le=settings.SPECIES_SUGGEST_LIMIT_MAX),
+        suggest_species_interactor: SuggestSpeciesInteractor = Depends(get_suggest_species_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        suggestions = await suggest_species_interactor.execute(prefix, limit)
+
+        return json_response(suggestions)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
+
+@animal_router.get("/changes")
+async def stream_animal_changes(
+        species: Optional[List[str]] = Query(None),
+        owner_id: Optional[int] = None,
+        uow: IUnitOfWork = Depends(get_uow),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    await uow.close()
+
+    try:
+        subscription = await change_feed.subscribe(species=species, owner_id=owner_id)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Лента изменений недоступна"
+        )
+
+    return StreamingResponse(
+        change_feed.stream(subscription, settings.CHANGE_FEED_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"cache-control": "no-cache", "x-accel-buffering": "no"},
+    )
+
+@animal_router.get("/export")
+async def export_animals(
+        format: AnimalExportFormat = "ndjson",
+        species: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        export_animals_interactor: ExportAnimalsInteractor = Depends(get_export_animals_interactor),
+        uow: IUnitOfWork = Depends(get_uow),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    await uow.close()
+
+    return StreamingResponse(
+        export_animals_interactor.execute(format, species, owner_id, created_from, created_to),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"content-disposition": f'attachment; filename="animals.{format}"'},
+    )
+
 @animal_router.delete("/delete_animal_by_id/{id}")
 async def delete_animal_by_id(
         id: int,
         get_delete_animal_by_id_interactor: DeleteAnimalByIdInteractor = Depends(get_delete_animal_by_id_interactor),
-        current_user: UserSchema = Depends(get_current_user_dependency)
+        current_user: UserResponse = Depends(get_current_user_dependency)
 ):
     try:
         await get_delete_animal_by_id_interactor.execute(id)
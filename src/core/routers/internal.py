@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends
+
+from src.core.models.session_factory import get_pool_stats
+from src.core.repositories.animals_cache import animal_cache
+from src.core.services.users_service import get_current_user_dependency
+from src.core.utils.change_feed import change_feed
+from src.core.utils.single_flight import animal_reads
+from src.core.utils.species_index import species_index
+from src.core.utils.token_cache import token_cache
+
+internal_router = APIRouter(
+    prefix="/internal", tags=["internal"], dependencies=[Depends(get_current_user_dependency)]
+)
+
+
+@internal_router.get("/pool")
+async def pool_stats():
+    return get_pool_stats()
+
+
+@internal_router.get("/cache")
+async def cache_stats():
+    return {
+        "animals": animal_cache.stats.as_dict(),
+        "tokens": token_cache.stats(),
+        "species_index": species_index.stats(),
+    }
+
+
+@internal_router.get("/single_flight")
+async def single_flight_stats():
+    return animal_reads.stats()
+
+
+@internal_router.get("/change_feed")
+async def change_feed_stats():
+    return change_feed.stats()
@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
 import logging
 
-from src.core.dtos.auth_dto import TokenResponse, LoginRequest
-from src.core.dtos.user_dto import CreateUser, AdoptAnimalResponse, UserSchema
+from src.core.dtos.auth_dto import TokenResponse, LoginRequest, RefreshTokenRequest
+from src.config.settings import settings
+from src.core.dtos.user_dto import CreateUser, AdoptAnimalResponse, UserResponse, UserAnimalsPage, \
+    BulkOwnershipRequest, BulkOwnershipResponse
+from src.core.dtos.zoo_dto import AnimalOrder
 from src.core.interactors.users_interactors import RegisterUserInteractor, get_register_user_interactor, \
     AuthenticateUserInteractor, get_authenticate_user_interactor, AdoptAnimalInteractor, get_adopt_animal_interactor, \
-    get_release_animal_interactor, ReleaseAnimalInteractor
+    get_release_animal_interactor, ReleaseAnimalInteractor, RefreshTokenInteractor, get_refresh_token_interactor, \
+    GetUserAnimalsInteractor, get_user_animals_interactor, BulkAdoptAnimalsInteractor, \
+    get_bulk_adopt_animals_interactor, BulkReleaseAnimalsInteractor, get_bulk_release_animals_interactor
 from src.core.services.users_service import get_current_user_dependency
+from src.core.utils.serialization import json_response
 
 logger = logging.getLogger(__name__)
 
@@ -63,16 +71,36 @@ async def login(
         )
 
 
+@user_router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(
+        request: RefreshTokenRequest,
+        refresh_token_interactor: RefreshTokenInteractor = Depends(get_refresh_token_interactor)
+):
+    try:
+        tokens = await refresh_token_interactor.execute(request)
+        return tokens
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        logger.error(f"Неизвестная ошибка при обновлении токена: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
+
+
 @user_router.post("/adopt_animal/{user_id}/{animal_id}", response_model=AdoptAnimalResponse)
 async def adopt_animal(
         user_id: int,
         animal_id: int,
         adopt_animal_interactor: AdoptAnimalInteractor = Depends(get_adopt_animal_interactor),
-        current_user: UserSchema = Depends(get_current_user_dependency)
+        current_user: UserResponse = Depends(get_current_user_dependency)
 ):
     try:
         adopt_request = await adopt_animal_interactor.execute(user_id, animal_id)
-        return adopt_request
+        return json_response(adopt_request)
 
     except HTTPException as e:
         raise e
@@ -85,17 +113,17 @@ async def adopt_animal(
         )
 
 
-@user_router.post("/release_animal/{user_id}/{animal_id}")
+@user_router.post("/release_animal/{user_id}/{animal_id}", response_model=AdoptAnimalResponse)
 async def adopt_animal(
         user_id: int,
         animal_id: int,
         release_animal_interactor: ReleaseAnimalInteractor = Depends(get_release_animal_interactor),
-        current_user: UserSchema = Depends(get_current_user_dependency)
+        current_user: UserResponse = Depends(get_current_user_dependency)
 ):
     try:
         release_request = await release_animal_interactor.execute(user_id, animal_id)
 
-        return release_request
+        return json_response(release_request)
 
     except HTTPException as e:
         raise e
@@ -106,3 +134,89 @@ async def adopt_animal(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Произошла внутренняя ошибка сервера",
         )
+
+
+@user_router.post("/adopt_animals/{user_id}", response_model=BulkOwnershipResponse)
+async def adopt_animals(
+        user_id: int,
+        request: BulkOwnershipRequest,
+        bulk_adopt_animals_interactor: BulkAdoptAnimalsInteractor = Depends(get_bulk_adopt_animals_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        result = await bulk_adopt_animals_interactor.execute(user_id, request.animal_ids)
+
+        return json_response(result)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        logger.error(f"Неизвестная ошибка при массовом приручении животных: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
+
+
+@user_router.post("/release_animals/{user_id}", response_model=BulkOwnershipResponse)
+async def release_animals(
+        user_id: int,
+        request: BulkOwnershipRequest,
+        bulk_release_animals_interactor: BulkReleaseAnimalsInteractor = Depends(get_bulk_release_animals_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        result = await bulk_release_animals_interactor.execute(user_id, request.animal_ids)
+
+        return json_response(result)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        logger.error(f"Неизвестная ошибка при массовом освобождении животных: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
+
+
+@user_router.get("/users/me/animals", response_model=UserAnimalsPage)
+async def get_my_animals(
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        cursor: Optional[str] = None,
+        order_by: AnimalOrder = "id",
+        include_total: bool = False,
+        get_user_animals_interactor: GetUserAnimalsInteractor = Depends(get_user_animals_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    return await get_user_animals(
+        current_user.id, limit, cursor, order_by, include_total, get_user_animals_interactor, current_user
+    )
+
+
+@user_router.get("/users/{user_id}/animals", response_model=UserAnimalsPage)
+async def get_user_animals(
+        user_id: int,
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        cursor: Optional[str] = None,
+        order_by: AnimalOrder = "id",
+        include_total: bool = False,
+        get_user_animals_interactor: GetUserAnimalsInteractor = Depends(get_user_animals_interactor),
+        current_user: UserResponse = Depends(get_current_user_dependency)
+):
+    try:
+        animals = await get_user_animals_interactor.execute(user_id, limit, cursor, order_by, include_total)
+
+        return json_response(animals)
+
+    except HTTPException as e:
+        raise e
+
+    except Exception as e:
+        logger.error(f"Неизвестная ошибка при получении животных пользователя: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Произошла внутренняя ошибка сервера",
+        )
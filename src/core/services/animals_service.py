@@ -1,17 +1,26 @@
 from datetime import datetime
 
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.models.session_factory import get_async_session
 from src.core.repositories.animals_repository import AnimalsRepository, AnimalsRepositoryProtocol, get_animals_repository
 
-from typing import Protocol, Tuple, Optional, List, Annotated
+from typing import Protocol, Tuple, Optional, List, Annotated, Any, AsyncIterator, Awaitable, Callable, Hashable
 
-from src.core.dtos.zoo_dto import CreateAnimal, AnimalSchema, UpdateAnimalRequest, UpdateAnimalResponse, DeleteAnimalRequest
+from src.core.dtos.zoo_dto import CreateAnimal, AnimalSchema, UpdateAnimalRequest, UpdateAnimalResponse, DeleteAnimalRequest, \
+    AnimalPage, BulkCreateAnimalError, BulkCreateAnimalsResponse, AnimalsByIdsResponse, SpeciesStatsSchema, \
+    SpeciesSuggestions, AnimalChangeEvent
+from src.config.settings import settings
+from src.core.utils.serialization import animal_list_adapter, csv_chunk, ndjson_chunk
+from src.core.utils.single_flight import SingleFlight, animal_reads
+from src.core.utils.species_index import SpeciesIndex, species_index
 
 from fastapi import HTTPException, status, Depends
 
-from src.core.repositories.uow import IUnitOfWork, get_uow
+from src.core.repositories.uow import IUnitOfWork, get_uow, create_uow
+from src.core.repositories.animals_cache import AnimalCache, animal_cache
+from src.core.repositories.species_stats_repository import SpeciesStatsDelta
 
 import logging
 
@@ -22,22 +31,48 @@ class AnimalServiceProtocol(Protocol):
     async def create_animal(self, animal_data: CreateAnimal) -> AnimalSchema:
         ...
 
+    async def create_animals(self, animals_data: List[Any]) -> BulkCreateAnimalsResponse:
+        ...
+
     async def update_animal(self, update_animal_data: UpdateAnimalRequest) -> UpdateAnimalResponse:
         ...
 
     async def get_animal_by_id(self, id: int) -> Optional[AnimalSchema]:
         ...
 
-    async def get_animals_by_species(self, species: str) -> List[AnimalSchema]:
+    async def get_animals_by_ids(self, ids: List[int]) -> AnimalsByIdsResponse:
+        ...
+
+    async def get_animals_by_species(self, species: str, limit: int, cursor: Optional[str] = None,
+                                     order_by: str = "id") -> AnimalPage:
+        ...
+
+    async def search_animals(self, query: str, match: str, limit: int, cursor: Optional[str] = None) -> AnimalPage:
+        ...
+
+    async def suggest_species(self, prefix: str, limit: int) -> SpeciesSuggestions:
+        ...
+
+    def export_animals(self, format: str, species: Optional[str] = None, owner_id: Optional[int] = None,
+                       created_from: Optional[datetime] = None,
+                       created_to: Optional[datetime] = None) -> AsyncIterator[bytes]:
         ...
 
     async def delete_animal_by_id(self, id: int) -> bool:
         ...
 
+    async def get_species_stats(self) -> List[SpeciesStatsSchema]:
+        ...
+
 
 class AnimalService:
-    def __init__(self, uow: IUnitOfWork):
+    def __init__(self, uow: IUnitOfWork, cache: AnimalCache = animal_cache, single_flight: SingleFlight = animal_reads,
+                 species_index: SpeciesIndex = species_index, uow_factory: Callable[[], IUnitOfWork] = create_uow):
         self.uow = uow
+        self.uow_factory = uow_factory
+        self.cache = cache
+        self.single_flight = single_flight
+        self.species_index = species_index
 
     async def create_animal(self, animal_data: CreateAnimal) -> AnimalSchema:
         async with self.uow as uow:
@@ -53,7 +88,15 @@ class AnimalService:
                 new_animal = await uow.animals.add_one(animal_dict)
                 animal_response = AnimalSchema.model_validate(new_animal)
 
+                await uow.species_stats.apply(
+                    SpeciesStatsDelta().animal_added(new_animal.species, new_animal.age)
+                )
+                await uow.changes.publish([
+                    AnimalChangeEvent(event="created", id=new_animal.id, species=new_animal.species, age=new_animal.age)
+                ])
+
                 await uow.commit()
+                self.species_index.add(new_animal.species)
 
             except Exception as e:
                 await uow.rollback()
@@ -61,6 +104,59 @@ class AnimalService:
 
             return animal_response
 
+    async def create_animals(self, animals_data: List[Any]) -> BulkCreateAnimalsResponse:
+        valid_rows = []
+        errors = []
+        created_at = datetime.utcnow()
+
+        for index, row in enumerate(animals_data):
+            try:
+                animal_dict = CreateAnimal.model_validate(row).model_dump()
+                animal_dict["created_at"] = created_at
+                valid_rows.append(animal_dict)
+
+            except ValidationError as e:
+                errors.append(BulkCreateAnimalError(
+                    index=index,
+                    errors=[f"{'.'.join(str(loc) for loc in error['loc']) or 'row'}: {error['msg']}" for error in e.errors()]
+                ))
+
+        if not valid_rows:
+            return BulkCreateAnimalsResponse(created=[], errors=errors)
+
+        async with self.uow as uow:
+            try:
+                if len(valid_rows) >= settings.BULK_COPY_THRESHOLD:
+                    new_animals = await uow.animals.copy_many(valid_rows, columns=("species", "age", "created_at"))
+                else:
+                    new_animals = await uow.animals.add_many(valid_rows, batch_size=settings.BULK_INSERT_BATCH_SIZE)
+
+                created = animal_list_adapter.validate_python(new_animals, from_attributes=True)
+
+                delta = SpeciesStatsDelta()
+                for animal in valid_rows:
+                    delta.animal_added(animal["species"], animal["age"])
+
+                await uow.species_stats.apply(delta)
+                await uow.changes.publish([
+                    AnimalChangeEvent(event="created", id=animal.id, species=animal.species, age=animal.age)
+                    for animal in created
+                ])
+                await uow.commit()
+
+                for species in {animal["species"] for animal in valid_rows}:
+                    self.species_index.add(species)
+
+            except Exception as e:
+                await uow.rollback()
+                logger.error(f"Неизвестная ошибка при массовом создании животных {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Не удалось создать животных"
+                )
+
+            return BulkCreateAnimalsResponse(created=created, errors=errors)
+
     async def update_animal(self, animal_data: UpdateAnimalRequest) -> UpdateAnimalResponse:
         async with self.uow as uow:
             update_exception = HTTPException(
@@ -76,11 +172,28 @@ class AnimalService:
                 if animal_data.species is not None:
                     update_data["species"] = animal_data.species
 
-                new_animal = await uow.animals.edit_one(data=update_data, inst_id=animal_data.id)
+                new_animal = await uow.animals.edit_one_with_previous(data=update_data, inst_id=animal_data.id)
+
+                if new_animal is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Животное не найдено"
+                    )
+
+                await uow.species_stats.apply(
+                    SpeciesStatsDelta()
+                    .animal_removed(new_animal.previous_species, new_animal.previous_age, new_animal.master_id)
+                    .animal_added(new_animal.species, new_animal.age, new_animal.master_id)
+                )
+                await uow.changes.publish([
+                    AnimalChangeEvent(event="updated", id=new_animal.id, species=new_animal.species,
+                                      age=new_animal.age, master_id=new_animal.master_id)
+                ])
                 await uow.commit()
+                await self.cache.invalidate(animal_data.id)
 
-                if not hasattr(new_animal, 'id'):
-                    raise ValueError("Новая запись не содержит id")
+                if new_animal.species != new_animal.previous_species:
+                    self.species_index.invalidate()
 
                 return UpdateAnimalResponse(
                                             species=new_animal.species,
@@ -103,37 +216,153 @@ class AnimalService:
             detail="Не удалось найти животное по id"
         )
 
-        async with self.uow as uow:
-            animal = await uow.animals.find_one(inst_id=id)
+        async def load_animal(load_uow: IUnitOfWork):
+            # Кеш заполняется только с основной базы: отстающая реплика вернула бы данные до инвалидации
+            async with load_uow.read_only(consistent=True) as uow:
+                return await uow.animals.find_one(inst_id=id)
 
-            if not animal:
-                raise search_exception
+        # Поколение в ключе не даёт чтению после инвалидации присоединиться к загрузке, начатой до неё
+        animal = await self.cache.get_or_load(
+            id, lambda: self._load_shared(("animal", id, self.cache.generation(id)), load_animal)
+        )
+
+        if not animal:
+            raise search_exception
+
+        return animal
+
+    async def get_animals_by_ids(self, ids: List[int]) -> AnimalsByIdsResponse:
+        unique_ids = list(dict.fromkeys(ids))
+
+        async with self.uow.read_only() as uow:
+            animals = await uow.animals.find_many(inst_ids=unique_ids)
+
+        animals_by_id = {animal.id: animal for animal in animals}
 
-            return animal
+        return AnimalsByIdsResponse(
+            items=animal_list_adapter.validate_python(
+                [animals_by_id[animal_id] for animal_id in unique_ids if animal_id in animals_by_id],
+                from_attributes=True
+            ),
+            missing_ids=[animal_id for animal_id in unique_ids if animal_id not in animals_by_id]
+        )
 
-    async def get_animals_by_species(self, species: str):
+    async def get_animals_by_species(self, species: str, limit: int, cursor: Optional[str] = None,
+                                     order_by: str = "id") -> AnimalPage:
         search_exception = HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Не удалось найти животное по виду"
         )
 
-        async with self.uow as uow:
-            try:
-                animals = await uow.animals.get_animals_by_species(species=species)
+        async def load_page(load_uow: IUnitOfWork):
+            async with load_uow.read_only() as uow:
+                try:
+                    animals, next_cursor = await uow.animals.get_animals_by_species(
+                        species=species, limit=limit, cursor=cursor, order_by=order_by
+                    )
+
+                    if not animals and not cursor:
+                        raise search_exception
 
-                if not animals:
+                    return AnimalPage(
+                        items=animal_list_adapter.validate_python(animals, from_attributes=True),
+                        next_cursor=next_cursor
+                    )
+
+                except ValueError as e:
+                    logger.error(f"Ошибка пагинации при получении списка животных {e}")
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=str(e)
+                    )
+
+                except HTTPException as e:
+                    logger.error(f"Ошибка при попытке получить список животных {e.detail}")
                     raise search_exception
 
-                return [AnimalSchema.model_validate(animal) for animal in animals]
+                except Exception as e:
+                    logger.error(f"Неизвестная ошибка при попытке получить список животных {e}")
+                    raise e
 
-            except HTTPException as e:
-                logger.error(f"Ошибка при попытке получить список животных {e.detail}")
-                raise search_exception
+        return await self._load_shared(("species", species, limit, cursor, order_by), load_page)
+
+    async def _load_shared(self, key: Hashable, load: Callable[[IUnitOfWork], Awaitable[Any]]) -> Any:
+        # Соединение, уже взятое запросом (например, при проверке токена), уходит общей загрузке вместе с
+        # сессией: запрос не ждёт второе соединение из пула, а его отмена не закрывает сессию под загрузкой
+        shared_uow = self.uow.detach()
+
+        if self.single_flight.in_flight(key):
+            # Загрузку выполнит другой запрос, поэтому своё соединение отпускаем до ожидания
+            await shared_uow.close()
+
+        async def run():
+            try:
+                return await load(shared_uow)
+
+            finally:
+                await shared_uow.close()
+
+        return await self.single_flight.do(key, run)
+
+    async def search_animals(self, query: str, match: str, limit: int, cursor: Optional[str] = None) -> AnimalPage:
+        if len(query) < settings.SPECIES_SEARCH_MIN_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Строка поиска должна быть не короче {settings.SPECIES_SEARCH_MIN_LENGTH} символов"
+            )
+
+        async with self.uow.read_only() as uow:
+            try:
+                animals, next_cursor = await uow.animals.search_by_species(
+                    query=query, match=match, limit=limit, cursor=cursor
+                )
+
+                return AnimalPage(
+                    items=animal_list_adapter.validate_python(animals, from_attributes=True),
+                    next_cursor=next_cursor
+                )
+
+            except ValueError as e:
+                logger.error(f"Ошибка пагинации при поиске животных {e}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
 
             except Exception as e:
-                logger.error(f"Неизвестная ошибка при попытке получить список животных {e}")
+                logger.error(f"Неизвестная ошибка при поиске животных {e}")
                 raise e
 
+    async def suggest_species(self, prefix: str, limit: int) -> SpeciesSuggestions:
+        async def load_species():
+            async with self.uow.read_only() as uow:
+                return [row.species for row in await uow.species_stats.find_all()]
+
+        return SpeciesSuggestions(items=await self.species_index.suggest(prefix, limit, load_species))
+
+    async def export_animals(self, format: str, species: Optional[str] = None, owner_id: Optional[int] = None,
+                             created_from: Optional[datetime] = None,
+                             created_to: Optional[datetime] = None) -> AsyncIterator[bytes]:
+        export_uow = self.uow_factory()
+
+        try:
+            if format == "csv":
+                yield csv_chunk((), header=True)
+
+            async with export_uow.read_only() as uow:
+                async for rows in uow.animals.stream_export(
+                    settings.EXPORT_CHUNK_SIZE, species=species, owner_id=owner_id,
+                    created_from=created_from, created_to=created_to
+                ):
+                    yield ndjson_chunk(rows) if format == "ndjson" else csv_chunk(rows)
+
+        except Exception as e:
+            logger.error(f"Ошибка при выгрузке животных {str(e)}")
+            raise e
+
+        finally:
+            await export_uow.close()
+
     async def delete_animal_by_id(self, id: int):
         delete_exception = HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -142,18 +371,26 @@ class AnimalService:
 
         async with self.uow as uow:
             try:
-                animal = await uow.animals.find_one(inst_id=id)
-
-                if not animal:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail="Животное не найдено"
-                    )
-
-                logger.info(f"найденное животное {animal}")
-
-                await uow.animals.delete_one(inst_id=animal.id)
+                deleted = await uow.animals.delete_one_returning(inst_id=id)
+
+                if deleted is None:
+                    raise ValueError("Объект не найден")
+
+                await uow.species_stats.apply(
+                    SpeciesStatsDelta().animal_removed(deleted.species, deleted.age, deleted.master_id)
+                )
+                await uow.changes.publish([
+                    AnimalChangeEvent(event="deleted", id=deleted.id, species=deleted.species,
+                                      age=deleted.age, previous_master_id=deleted.master_id)
+                ])
                 await uow.commit()
+                await self.cache.invalidate(id)
+                self.species_index.invalidate()
+
+            except ValueError as e:
+                await uow.rollback()
+                logger.error(f"Ошибка при попытке удалить животное {str(e)}")
+                raise delete_exception
 
             except HTTPException as e:
                 await uow.rollback()
@@ -165,6 +402,21 @@ class AnimalService:
                 logger.error(f"Неизвестная ошибка при попытке удалить животное {str(e)}")
                 raise e
 
+    async def get_species_stats(self) -> List[SpeciesStatsSchema]:
+        async with self.uow.read_only() as uow:
+            stats = await uow.species_stats.find_all()
+
+            return [
+                SpeciesStatsSchema(
+                    species=row.species,
+                    count=row.animal_count,
+                    average_age=row.age_sum / row.animal_count,
+                    adopted=row.adopted_count,
+                    unadopted=row.animal_count - row.adopted_count
+                )
+                for row in stats
+            ]
+
 async def get_animals_service(uow: IUnitOfWork = Depends(get_uow)) -> AnimalServiceProtocol:
     return AnimalService(uow=uow)
 
@@ -1,14 +1,21 @@
 from src.core.repositories.uow import IUnitOfWork, get_uow
+from src.core.repositories.animals_cache import AnimalCache, animal_cache
+from src.core.repositories.species_stats_repository import SpeciesStatsDelta
 from src.core.repositories.user_repository import UserRepository
 
 
-from typing import Protocol, Tuple, Optional, Annotated
+from typing import Protocol, Tuple, Optional, Annotated, List
 
-from src.core.dtos.user_dto import CreateUser, UserSchema, UserResponse, AnimalResponse, AdoptAnimalResponse
+from src.core.dtos.user_dto import CreateUser, UserSchema, UserResponse, AnimalResponse, AdoptAnimalResponse, \
+    UserAnimalsPage, BulkOwnershipResponse, AnimalOwnershipResult
 from src.core.dtos.auth_dto import TokenResponse
+from src.core.dtos.zoo_dto import AnimalChangeEvent
 from src.core.repositories.user_repository import UserRepositoryProtocol, get_user_repository
 
 from src.core.utils.jwt_handler import Hasher, JWTHandler, oauth2_scheme, get_jwt_handler
+from src.core.utils.serialization import animal_list_adapter
+from src.core.utils.token_cache import token_cache
+from src.core.utils.revocation_store import RevocationStore, revocation_store
 
 from fastapi import HTTPException, status, Depends
 
@@ -24,57 +31,105 @@ class UserServiceProtocol(Protocol):
     async def authenticate_user(self, username: str, password: str) -> Optional[TokenResponse]:
         ...
 
-    async def adopt_animal(self, user_id: int, animal_id: int):
+    async def refresh_tokens(self, refresh_token: str) -> TokenResponse:
         ...
 
-    async def release_animal(self, user_id: int, animal_id: int):
+    async def adopt_animal(self, user_id: int, animal_id: int) -> AdoptAnimalResponse:
+        ...
+
+    async def release_animal(self, user_id: int, animal_id: int) -> AdoptAnimalResponse:
+        ...
+
+    async def adopt_animals(self, user_id: int, animal_ids: List[int]) -> BulkOwnershipResponse:
+        ...
+
+    async def release_animals(self, user_id: int, animal_ids: List[int]) -> BulkOwnershipResponse:
+        ...
+
+    async def get_user_animals(self, user_id: int, limit: int, cursor: Optional[str] = None,
+                               order_by: str = "id", include_total: bool = False) -> UserAnimalsPage:
         ...
 
     async def get_current_user(self, auth_token: Optional[str]):
         ...
 
 class UserService:
-    def __init__(self, jwt_handler: JWTHandler, uow: IUnitOfWork):
+    def __init__(self, jwt_handler: JWTHandler, uow: IUnitOfWork, animal_cache: AnimalCache = animal_cache,
+                 revocation_store: RevocationStore = revocation_store):
         self.jwt_handler = jwt_handler
         self.uow = uow
+        self.animal_cache = animal_cache
+        self.revocation_store = revocation_store
 
     async def authenticate_user(self, username: str, password: str):
+        authentication_exception = HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Username или пароль не верны",
+        )
+
         async with self.uow as uow:
-            authentication_exception = HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Username или пароль не верны",
-            )
             user = await uow.users.get_user_by_username(username)
 
-            if not user:
-                raise authentication_exception
+        # Соединение возвращается в пул до проверки пароля: очередь на хеширование и bcrypt его не держат
+        await self.uow.close()
 
-            if user and Hasher.verify_password(password, user.hashed_password):
+        if not user:
+            raise authentication_exception
 
-                access_token = await self.jwt_handler.generate_access_token(data={ "username": user.username, "user_id": str(user.id) })
-                refresh_token = await self.jwt_handler.generate_refresh_token(data={ "username": user.username, "user_id": str(user.id) })
+        if await Hasher.verify_password_async(password, user.hashed_password):
 
-                return (TokenResponse(access_token=access_token, refresh_token=refresh_token, token_type="Bearer"))
+            access_token = await self.jwt_handler.generate_access_token(data={ "username": user.username, "user_id": str(user.id) })
+            refresh_token = await self.jwt_handler.generate_refresh_token(data={ "username": user.username, "user_id": str(user.id) })
 
-            return None
+            return (TokenResponse(access_token=access_token, refresh_token=refresh_token, token_type="Bearer"))
+
+        return None
+
+    async def refresh_tokens(self, refresh_token: str) -> TokenResponse:
+        token_exception = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Невалидный refresh токен",
+        )
+
+        payload = await self.jwt_handler.decode_token(refresh_token, token_type="refresh")
+
+        if not payload or not payload.get("jti") or not payload.get("username") or not payload.get("user_id"):
+            raise token_exception
+
+        if not self.revocation_store.revoke(payload["jti"], payload["exp"]):
+            logger.warning(f"Повторное использование refresh токена пользователем {payload['username']}")
+            raise token_exception
+
+        claims = {"username": payload["username"], "user_id": payload["user_id"]}
+        access_token = await self.jwt_handler.generate_access_token(data=claims)
+        new_refresh_token = await self.jwt_handler.generate_refresh_token(data=claims)
+
+        return TokenResponse(access_token=access_token, refresh_token=new_refresh_token, token_type="Bearer")
 
     async def register_user(self, user_data: CreateUser):
+        authentication_exception = HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Не удалось зарегистрировать пользователя"
+        )
+
         async with self.uow as uow:
-            authentication_exception = HTTPException(
+            existing_user = await uow.users.get_user_by_username(user_data.username)
+
+        # Хеширование идёт без соединения из пула, для вставки берётся новое
+        await self.uow.close()
+
+        if existing_user:
+            raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Не удалось зарегистрировать пользователя"
+                detail="Пользователь с таким именем уже существует"
             )
 
-            existing_user = await uow.users.get_user_by_username(user_data.username)
+        hashed_password = await Hasher.hash_password_async(user_data.password)
 
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Пользователь с таким именем уже существует"
-                )
+        async with self.uow as uow:
             try:
                 new_user = await uow.users.add_one({"username": user_data.username,
-                                                           "hashed_password": Hasher.hash_password(user_data.password)
+                                                           "hashed_password": hashed_password
                                                            })
 
 
@@ -101,54 +156,47 @@ class UserService:
         if not auth_token:
             raise token_exception
 
-        username = await self.jwt_handler.verify_token(auth_token, token_type="access")
+        cached_user = token_cache.get(auth_token)
 
-        if not username:
-            raise token_exception
+        if cached_user:
+            return cached_user
+
+        payload = await self.jwt_handler.decode_token(auth_token, token_type="access")
 
+        if not payload or not payload.get("username"):
+            raise token_exception
 
         async with self.uow as uow:
-            user = await uow.users.get_user_by_username(username)
+            user = await uow.users.get_user_by_username(payload["username"])
 
             if not user:
                 raise token_exception
 
-            return user
+            current_user = UserResponse(id=user.id, username=user.username)
+            token_cache.set(auth_token, current_user, token_exp=payload.get("exp"))
 
-    async def adopt_animal(self, user_id: int, animal_id: int):
-        exception = HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Неверные данные"
-        )
+            return current_user
 
+    async def adopt_animal(self, user_id: int, animal_id: int) -> AdoptAnimalResponse:
         async with self.uow as uow:
             try:
-                adopt_request = await uow.users.adopt_animal(user_id, animal_id)
-
-                if not adopt_request:
-                    raise exception
-
+                adopted = await uow.users.adopt_animal(user_id, animal_id)
+                await uow.species_stats.apply(SpeciesStatsDelta().add(adopted.species, adopted=1))
+                await uow.changes.publish([
+                    AnimalChangeEvent(event="adopted", id=adopted.id, species=adopted.species,
+                                      age=adopted.age, master_id=user_id)
+                ])
                 await uow.commit()
+                await self.animal_cache.invalidate(animal_id)
 
-                user_response = UserResponse(
-                    id=adopt_request.id,
-                    username=adopt_request.username
-                )
+                return self._ownership_response(user_id, adopted)
 
-                animals_response = [
-                    AnimalResponse(
-                        id=animal.id,
-                        species=animal.species,
-                        age=animal.age,
-                        created_at=animal.created_at,
-                        master_id=animal.master_id
-                    )
-                    for animal in adopt_request.animals
-                ]
-
-                return AdoptAnimalResponse(
-                    master=user_response,
-                    animals=animals_response
+            except ValueError as e:
+                await uow.rollback()
+                logger.error(f"Ошибка при попытке приручить животное {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
                 )
 
             except HTTPException as e:
@@ -161,21 +209,27 @@ class UserService:
                 logger.error(f"Неизвестная ошибка при попытке приручить животное {str(e)}")
                 raise e
 
-    async def release_animal(self, user_id: int, animal_id: int):
-        exception = HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Неверные данные"
-        )
-
+    async def release_animal(self, user_id: int, animal_id: int) -> AdoptAnimalResponse:
         async with self.uow as uow:
             try:
-                release_request = await uow.users.release_animal(user_id, animal_id)
+                released = await uow.users.release_animal(user_id, animal_id)
+                await uow.species_stats.apply(SpeciesStatsDelta().add(released.species, adopted=-1))
+                await uow.changes.publish([
+                    AnimalChangeEvent(event="released", id=released.id, species=released.species,
+                                      age=released.age, previous_master_id=user_id)
+                ])
+                await uow.commit()
+                await self.animal_cache.invalidate(animal_id)
 
-                if not release_request:
-                    raise exception
+                return self._ownership_response(user_id, released)
 
-                await uow.commit()
-                return release_request
+            except ValueError as e:
+                await uow.rollback()
+                logger.error(f"Ошибка при попытке отпустить животное {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
 
             except HTTPException as e:
                 await uow.rollback()
@@ -187,6 +241,132 @@ class UserService:
                 logger.error(f"Неизвестная ошибка при попытке отпустить животное {str(e)}")
                 raise e
 
+    async def adopt_animals(self, user_id: int, animal_ids: List[int]) -> BulkOwnershipResponse:
+        return await self._change_ownership(user_id, animal_ids, adopting=True)
+
+    async def release_animals(self, user_id: int, animal_ids: List[int]) -> BulkOwnershipResponse:
+        return await self._change_ownership(user_id, animal_ids, adopting=False)
+
+    async def _change_ownership(self, user_id: int, animal_ids: List[int], adopting: bool) -> BulkOwnershipResponse:
+        animal_ids = list(dict.fromkeys(animal_ids))
+
+        async with self.uow as uow:
+            try:
+                if adopting:
+                    rows = await uow.users.adopt_animals(user_id, animal_ids)
+                else:
+                    rows = await uow.users.release_animals(user_id, animal_ids)
+
+                if not rows or rows[0].username is None:
+                    raise ValueError("Пользователь не найден")
+
+                changed = [row for row in rows if row.changed]
+
+                delta = SpeciesStatsDelta()
+                for row in changed:
+                    delta.add(row.changed_species, adopted=1 if adopting else -1)
+
+                await uow.species_stats.apply(delta)
+                await uow.changes.publish([
+                    AnimalChangeEvent(
+                        event="adopted" if adopting else "released", id=row.id, species=row.changed_species,
+                        age=row.changed_age, master_id=user_id if adopting else None,
+                        previous_master_id=None if adopting else user_id
+                    )
+                    for row in changed
+                ])
+                await uow.commit()
+
+                if changed:
+                    await self.animal_cache.invalidate(*(row.id for row in changed))
+
+                rows_by_id = {row.id: row for row in rows}
+                return BulkOwnershipResponse(
+                    master=UserResponse(id=user_id, username=rows[0].username),
+                    results=[
+                        AnimalOwnershipResult(
+                            animal_id=animal_id, status=self._ownership_status(rows_by_id[animal_id], user_id, adopting)
+                        )
+                        for animal_id in animal_ids
+                    ]
+                )
+
+            except ValueError as e:
+                await uow.rollback()
+                logger.error(f"Ошибка при массовом изменении владельца животных {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+
+            except Exception as e:
+                await uow.rollback()
+                logger.error(f"Неизвестная ошибка при массовом изменении владельца животных {str(e)}")
+                raise e
+
+    @staticmethod
+    def _ownership_status(row, user_id: int, adopting: bool) -> str:
+        if row.changed:
+            return "adopted" if adopting else "released"
+
+        if not row.found:
+            return "not_found"
+
+        if not adopting:
+            return "not_owned"
+
+        return "already_owned" if row.previous_master_id == user_id else "owned_by_other"
+
+    async def get_user_animals(self, user_id: int, limit: int, cursor: Optional[str] = None,
+                               order_by: str = "id", include_total: bool = False) -> UserAnimalsPage:
+        async with self.uow.read_only() as uow:
+            try:
+                animals, next_cursor = await uow.animals.get_animals_by_owner(
+                    owner_id=user_id, limit=limit, cursor=cursor, order_by=order_by
+                )
+
+                if not animals and not cursor and await uow.users.find_one(inst_id=user_id) is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Пользователь не найден"
+                    )
+
+                total = await uow.animals.count_by_owner(user_id) if include_total else None
+
+                return UserAnimalsPage(
+                    items=animal_list_adapter.validate_python(animals, from_attributes=True),
+                    next_cursor=next_cursor,
+                    total=total
+                )
+
+            except ValueError as e:
+                logger.error(f"Ошибка пагинации при получении животных пользователя {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+
+            except HTTPException as e:
+                logger.error(f"Ошибка при получении животных пользователя {e.detail}")
+                raise e
+
+            except Exception as e:
+                logger.error(f"Неизвестная ошибка при получении животных пользователя {str(e)}")
+                raise e
+
+    @staticmethod
+    def _ownership_response(user_id: int, row) -> AdoptAnimalResponse:
+        return AdoptAnimalResponse(
+            master=UserResponse(id=user_id, username=row.username),
+            animal=AnimalResponse(
+                id=row.id,
+                species=row.species,
+                age=row.age,
+                created_at=row.created_at,
+                master_id=row.master_id
+            )
+        )
+
 
 async def get_user_service(
     jwt_handler: JWTHandler =  Depends(get_jwt_handler),
@@ -0,0 +1,197 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Protocol, Tuple
+
+from src.config.settings import settings
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackendError(Exception):
+    pass
+
+
+class CacheBackendProtocol(Protocol):
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float):
+        ...
+
+    async def delete(self, *keys: str):
+        ...
+
+
+class InMemoryCacheBackend:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float):
+        self._entries[key] = (value, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisCacheBackend:
+    def __init__(self, host: str, port: int, db: int = 0, password: Optional[str] = None, timeout: float = 0.5):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.execute("GET", key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float):
+        await self.execute("SET", key, value, "PX", str(int(ttl_seconds * 1000)))
+
+    async def delete(self, *keys: str):
+        if keys:
+            await self.execute("DEL", *keys)
+
+    async def execute(self, *args: Any) -> Any:
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await asyncio.wait_for(self._connect(), timeout=self.timeout)
+
+                return await asyncio.wait_for(self._send(*args), timeout=self.timeout)
+
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                await self.close()
+                raise CacheBackendError(f"Redis недоступен: {e!r}")
+
+            except BaseException:
+                # Отмена или ошибка посреди команды может оставить непрочитанный ответ, и следующий вызов прочёл бы чужой
+                await self.close()
+                raise
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+
+            except OSError:
+                pass
+
+        self._reader = None
+        self._writer = None
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+        if self.password:
+            await self._send("AUTH", self.password)
+
+        if self.db:
+            await self._send("SELECT", str(self.db))
+
+    async def _send(self, *args: Any) -> Any:
+        self._writer.write(self._encode(args))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    @staticmethod
+    def _encode(args: Tuple[Any, ...]) -> bytes:
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(f"${len(data)}\r\n".encode())
+            parts.append(data)
+            parts.append(b"\r\n")
+
+        return b"".join(parts)
+
+    async def _read_reply(self) -> Any:
+        line = await self._reader.readuntil(b"\r\n")
+        prefix, payload = line[:1], line[1:-2]
+
+        if prefix == b"+":
+            return payload.decode()
+
+        if prefix == b"-":
+            raise CacheBackendError(payload.decode())
+
+        if prefix == b":":
+            return int(payload)
+
+        if prefix == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+
+        if prefix == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+
+            items: List[Any] = []
+            for _ in range(length):
+                items.append(await self._read_reply())
+
+            return items
+
+        raise CacheBackendError(f"Неизвестный ответ Redis: {line!r}")
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def as_dict(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+def get_cache_backend() -> CacheBackendProtocol:
+    if settings.ANIMAL_CACHE_BACKEND == "redis":
+        return RedisCacheBackend(
+            host=settings.ANIMAL_CACHE_REDIS_HOST,
+            port=settings.ANIMAL_CACHE_REDIS_PORT,
+            db=settings.ANIMAL_CACHE_REDIS_DB,
+            password=settings.ANIMAL_CACHE_REDIS_PASSWORD,
+            timeout=settings.ANIMAL_CACHE_REDIS_TIMEOUT_SECONDS,
+        )
+
+    if settings.ANIMAL_CACHE_BACKEND == "memory":
+        return InMemoryCacheBackend(max_size=settings.ANIMAL_CACHE_MAX_SIZE)
+
+    raise ValueError(f"Неизвестный бэкенд кеша: {settings.ANIMAL_CACHE_BACKEND}")
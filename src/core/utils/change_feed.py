@@ -0,0 +1,165 @@
+import asyncio
+import json
+from typing import AsyncIterator, Iterable, Optional, Set
+
+import asyncpg
+
+from src.config.settings import settings, db, DBSettings
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "animal_changes"
+
+
+class ChangeEvent:
+    __slots__ = ("payload", "species", "owners")
+
+    def __init__(self, payload: str):
+        data = json.loads(payload)
+        self.payload = payload
+        self.species: str = data["species"]
+        self.owners = {data.get("master_id"), data.get("previous_master_id")} - {None}
+
+
+class Subscription:
+    def __init__(self, queue_size: int, species: Optional[Iterable[str]] = None, owner_id: Optional[int] = None):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.species: Optional[Set[str]] = set(species) if species else None
+        self.owner_id = owner_id
+        self.dropped = 0
+
+    def matches(self, event: ChangeEvent) -> bool:
+        if self.species is not None and event.species not in self.species:
+            return False
+
+        return self.owner_id is None or self.owner_id in event.owners
+
+    def offer(self, event: ChangeEvent) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+    def take_dropped(self) -> int:
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class ChangeFeed:
+    def __init__(self, settings: DBSettings, queue_size: int, reconnect_seconds: float):
+        self.settings = settings
+        self.queue_size = queue_size
+        self.reconnect_seconds = reconnect_seconds
+        self._subscriptions: Set[Subscription] = set()
+        self._connection: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self.delivered = 0
+
+    async def subscribe(self, species: Optional[Iterable[str]] = None, owner_id: Optional[int] = None) -> Subscription:
+        await self._ensure_listening()
+        subscription = Subscription(self.queue_size, species, owner_id)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.discard(subscription)
+
+    async def stream(self, subscription: Subscription, heartbeat_seconds: float) -> AsyncIterator[str]:
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), heartbeat_seconds)
+
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+
+                dropped = subscription.take_dropped()
+                if dropped:
+                    yield f"event: dropped\ndata: {json.dumps({'count': dropped})}\n\n"
+
+                yield f"event: change\ndata: {event.payload}\n\n"
+
+        finally:
+            self.unsubscribe(subscription)
+
+    async def close(self):
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+
+    def stats(self) -> dict:
+        return {
+            "listening": self._connection is not None,
+            "subscribers": len(self._subscriptions),
+            "delivered": self.delivered,
+            "dropped": sum(subscription.dropped for subscription in self._subscriptions),
+        }
+
+    async def _ensure_listening(self):
+        if self._connection is not None:
+            return
+
+        async with self._lock:
+            if self._connection is not None:
+                return
+
+            connection = await asyncpg.connect(
+                host=self.settings.host,
+                port=self.settings.port,
+                user=self.settings.user,
+                password=self.settings.password,
+                database=self.settings.name,
+            )
+            await connection.add_listener(CHANNEL, self._on_notify)
+            connection.add_termination_listener(self._on_terminate)
+            self._connection = connection
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        try:
+            event = ChangeEvent(payload)
+
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Некорректное событие в ленте изменений: {str(e)}")
+            return
+
+        for subscription in self._subscriptions:
+            if subscription.matches(event) and subscription.offer(event):
+                self.delivered += 1
+
+    def _on_terminate(self, connection):
+        if connection is not self._connection:
+            return
+
+        logger.warning("Соединение ленты изменений разорвано, переподключение")
+        self._connection = None
+
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self):
+        while self._subscriptions and self._connection is None:
+            await asyncio.sleep(self.reconnect_seconds)
+
+            try:
+                await self._ensure_listening()
+
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Не удалось переподключить ленту изменений: {str(e)}")
+
+
+change_feed = ChangeFeed(
+    db,
+    queue_size=settings.CHANGE_FEED_QUEUE_SIZE,
+    reconnect_seconds=settings.CHANGE_FEED_RECONNECT_SECONDS,
+)
@@ -0,0 +1,64 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from src.config.settings import settings
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HashingPool:
+    def __init__(self, executor_type: str, max_workers: int, max_concurrency: int, queue_timeout: float):
+        if executor_type not in ("thread", "process"):
+            raise ValueError(f"Неизвестный тип пула для хеширования: {executor_type}")
+
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[Executor] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hasher")
+
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+
+        except asyncio.TimeoutError:
+            logger.error("Очередь на хеширование пароля переполнена")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Сервер перегружен, попробуйте позже",
+            )
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+
+        finally:
+            self._semaphore.release()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_pool = HashingPool(
+    executor_type=settings.HASHER_EXECUTOR,
+    max_workers=settings.HASHER_MAX_WORKERS,
+    max_concurrency=settings.HASHER_MAX_CONCURRENCY,
+    queue_timeout=settings.HASHER_QUEUE_TIMEOUT_SECONDS,
+)
@@ -1,9 +1,11 @@
 import jwt
+import uuid
 from datetime import datetime, timedelta
 
 from fastapi.security import OAuth2PasswordBearer
 
 from src.config.settings import settings
+from src.core.utils.hashing_pool import hashing_pool
 from passlib.context import CryptContext
 
 
@@ -28,20 +30,27 @@ class JWTHandler:
         to_encode = data.copy()
 
         expire = datetime.utcnow() + (expires_delta if expires_delta else self.refresh_token_expiration)
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
 
         return jwt.encode(to_encode, self.refresh_secret_key, algorithm=self.algorithm)
 
 
-    async def verify_token(self, token: str, token_type: str = ''):
+    async def decode_token(self, token: str, token_type: str = ''):
         try:
             secret_key = self.access_secret_key if token_type == 'access' else self.refresh_secret_key
-            payload = jwt.decode(token, secret_key, algorithms=[self.algorithm])
-            return payload.get('username')
+            return jwt.decode(token, secret_key, algorithms=[self.algorithm])
 
         except jwt.PyJWTError as e:
             return None
 
+    async def verify_token(self, token: str, token_type: str = ''):
+        payload = await self.decode_token(token, token_type)
+
+        if not payload:
+            return None
+
+        return payload.get('username')
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -55,6 +64,14 @@ class Hasher:
     def hash_password(password: str):
         return pwd_context.hash(password)
 
+    @staticmethod
+    async def verify_password_async(planned_password: str, hashed_password: bytes):
+        return await hashing_pool.run(Hasher.verify_password, planned_password, hashed_password)
+
+    @staticmethod
+    async def hash_password_async(password: str):
+        return await hashing_pool.run(Hasher.hash_password, password)
+
 
 async def get_jwt_handler() -> JWTHandler:
     return JWTHandler(
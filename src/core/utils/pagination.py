@@ -0,0 +1,42 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.config.settings import settings
+
+ORDER_FIELDS = ("id", "created_at")
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return settings.PAGE_SIZE_DEFAULT
+
+    return min(limit, settings.PAGE_SIZE_MAX)
+
+
+def encode_cursor(order_by: str, last_id: int, last_created_at: Optional[datetime] = None) -> str:
+    data: Dict[str, Any] = {"o": order_by, "id": last_id}
+    if order_by == "created_at":
+        data["c"] = last_created_at.isoformat()
+
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+        if data.get("o") != order_by or not isinstance(data.get("id"), int):
+            raise ValueError
+
+        if order_by == "created_at":
+            data["c"] = datetime.fromisoformat(data["c"])
+
+        return data
+
+    except (ValueError, KeyError, TypeError, AttributeError, binascii.Error):
+        raise ValueError("Некорректный курсор пагинации")
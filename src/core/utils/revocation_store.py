@@ -0,0 +1,38 @@
+import heapq
+import time
+from typing import Dict, List, Tuple
+
+
+class RevocationStore:
+    def __init__(self):
+        self._revoked: Dict[str, float] = {}
+        self._expirations: List[Tuple[float, str]] = []
+
+    def revoke(self, token_id: str, expires_at: float) -> bool:
+        self._evict_expired()
+
+        if token_id in self._revoked:
+            return False
+
+        if expires_at <= time.time():
+            return True
+
+        self._revoked[token_id] = expires_at
+        heapq.heappush(self._expirations, (expires_at, token_id))
+        return True
+
+    def is_revoked(self, token_id: str) -> bool:
+        self._evict_expired()
+        return token_id in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def _evict_expired(self):
+        now = time.time()
+        while self._expirations and self._expirations[0][0] <= now:
+            _, token_id = heapq.heappop(self._expirations)
+            self._revoked.pop(token_id, None)
+
+
+revocation_store = RevocationStore()
@@ -0,0 +1,44 @@
+import csv
+import io
+import json
+from typing import List, Sequence
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+from src.core.dtos.zoo_dto import AnimalSchema, SpeciesStatsSchema
+
+animal_list_adapter = TypeAdapter(List[AnimalSchema])
+species_stats_adapter = TypeAdapter(List[SpeciesStatsSchema])
+
+EXPORT_COLUMNS = ("id", "species", "age", "master_id", "created_at")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def json_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(content=model.model_dump_json(), media_type="application/json", status_code=status_code)
+
+
+def json_list_response(adapter: TypeAdapter, items: list, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(content=adapter.dump_json(items), media_type="application/json", status_code=status_code)
+
+
+def ndjson_chunk(rows: Sequence[Sequence]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=lambda value: value.isoformat()) + "\n"
+        for row in rows
+    ).encode()
+
+
+def csv_chunk(rows: Sequence[Sequence], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+
+    writer.writerows(
+        (animal_id, species, age, "" if master_id is None else master_id, created_at.isoformat())
+        for animal_id, species, age, master_id, created_at in rows
+    )
+    return buffer.getvalue().encode()
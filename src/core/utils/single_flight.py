@@ -0,0 +1,47 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    def __init__(self, max_tracked_keys: int = 1000):
+        self.max_tracked_keys = max_tracked_keys
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._stats: "OrderedDict[Hashable, Dict[str, int]]" = OrderedDict()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        stats = self._key_stats(key)
+        stats["calls"] += 1
+
+        if task is None:
+            stats["executions"] += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        else:
+            stats["coalesced"] += 1
+
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._in_flight
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {repr(key): dict(value) for key, value in self._stats.items()}
+
+    def _key_stats(self, key: Hashable) -> Dict[str, int]:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {"calls": 0, "executions": 0, "coalesced": 0}
+            while len(self._stats) > self.max_tracked_keys:
+                self._stats.popitem(last=False)
+
+        else:
+            self._stats.move_to_end(key)
+
+        return stats
+
+
+animal_reads = SingleFlight()
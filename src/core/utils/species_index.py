@@ -0,0 +1,52 @@
+import asyncio
+import time
+from bisect import bisect_left, insort
+from typing import Awaitable, Callable, Iterable, List
+
+from src.config.settings import settings
+
+
+class SpeciesIndex:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: List[tuple] = []
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        self._expires_at = 0.0
+
+    def add(self, species: str):
+        entry = (species.lower(), species)
+        position = bisect_left(self._entries, entry)
+
+        if position == len(self._entries) or self._entries[position] != entry:
+            insort(self._entries, entry)
+
+    async def suggest(self, prefix: str, limit: int, loader: Callable[[], Awaitable[Iterable[str]]]) -> List[str]:
+        if time.monotonic() >= self._expires_at:
+            async with self._lock:
+                if time.monotonic() >= self._expires_at:
+                    species = await loader()
+                    self._entries = sorted({(name.lower(), name) for name in species})
+                    self._expires_at = time.monotonic() + self.ttl_seconds
+
+        key = prefix.lower()
+        suggestions = []
+
+        for lowered, species in self._entries[bisect_left(self._entries, (key,)):]:
+            if not lowered.startswith(key) or len(suggestions) >= limit:
+                break
+
+            suggestions.append(species)
+
+        return suggestions
+
+    def stats(self) -> dict:
+        return {
+            "species": len(self._entries),
+            "expires_in_seconds": max(0.0, self._expires_at - time.monotonic()),
+        }
+
+
+species_index = SpeciesIndex(ttl_seconds=settings.SPECIES_INDEX_TTL_SECONDS)
@@ -0,0 +1,95 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from src.config.settings import settings
+from src.core.dtos.user_dto import UserResponse
+
+
+@dataclass
+class _CacheEntry:
+    user: UserResponse
+    expires_at: float
+
+
+class TokenCache:
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[str]] = {}
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[UserResponse]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.user
+
+    def set(self, token: str, user: UserResponse, token_exp: Optional[float] = None):
+        ttl = self.ttl_seconds
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+
+        if ttl <= 0:
+            return
+
+        key = self._key(token)
+        self._remove(key)
+        self._entries[key] = _CacheEntry(user=user, expires_at=time.monotonic() + ttl)
+        self._keys_by_user.setdefault(user.id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def invalidate_token(self, token: str):
+        self._remove(self._key(token))
+
+    def invalidate_user(self, user_id: int):
+        for key in list(self._keys_by_user.get(user_id, ())):
+            self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        user_keys = self._keys_by_user.get(entry.user.id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[entry.user.id]
+
+
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE, ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS)
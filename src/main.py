@@ -1,17 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 import uvicorn
 
-from dotenv import load_dotenv
-
+import logging
 import os
-
 import sys
+import time
 
+from src.config.settings import db
+from src.core.models.session_factory import database
 from src.core.routers.animals import animal_router
+from src.core.utils.change_feed import change_feed
+from src.core.utils.hashing_pool import hashing_pool
+
+logger = logging.getLogger(__name__)
+
 
-load_dotenv()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    await database.warm_up(db.warmup_connections)
+    app.state.startup_seconds = time.perf_counter() - started
+    logger.info(f"Приложение запущено за {app.state.startup_seconds * 1000:.1f} мс")
 
-app = FastAPI()
+    yield
+
+    await change_feed.close()
+    await database.dispose()
+    hashing_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 pythonpath = os.getenv('PYTHONPATH')
 
@@ -20,9 +40,16 @@ if pythonpath:
     sys.path.append(pythonpath)
 
 from src.core.routers.users import user_router
+from src.core.routers.internal import internal_router
+from src.core.routers.metrics import metrics_router
+from src.core.utils.metrics import MetricsMiddleware
 
 app.include_router(user_router)
 app.include_router(animal_router)
+app.include_router(internal_router)
+app.include_router(metrics_router)
+
+app.add_middleware(MetricsMiddleware)
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,62 @@
+import asyncio
+import os
+
+import pytest
+
+TEST_DB_NAME = os.getenv("TEST_DB_NAME")
+
+if TEST_DB_NAME:
+    # Тесты пересоздают данные, поэтому рабочую базу никогда не трогаем
+    os.environ["DB_NAME"] = TEST_DB_NAME
+
+os.environ.setdefault("access_secret_key", "test-access")
+os.environ.setdefault("refresh_secret_key", "test-refresh")
+os.environ.setdefault("TOKEN_TYPE", "bearer")
+
+
+def requires_database():
+    if not TEST_DB_NAME:
+        pytest.skip("TEST_DB_NAME не задан, тесты с базой пропущены", allow_module_level=True)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def run(event_loop):
+    return event_loop.run_until_complete
+
+
+@pytest.fixture(scope="session")
+def migrated():
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config("alembic.ini"), "head")
+
+
+@pytest.fixture(scope="session")
+def database(migrated, run):
+    from src.core.models.session_factory import database
+
+    yield database
+
+    run(database.dispose())
+
+
+@pytest.fixture
+def clean_database(database, run):
+    from sqlalchemy import text
+
+    async def truncate():
+        async with database.engine.begin() as connection:
+            await connection.execute(
+                text('TRUNCATE animal, "user", species_stats RESTART IDENTITY CASCADE')
+            )
+
+    run(truncate())
+    return database
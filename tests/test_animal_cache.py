@@ -0,0 +1,80 @@
+import asyncio
+
+from src.core.models.models import Animal
+from src.core.repositories.animals_cache import AnimalCache
+from src.core.utils.cache import InMemoryCacheBackend
+
+
+def make_animal(animal_id: int, age: int) -> Animal:
+    animal = Animal(species="zebra", age=age)
+    animal.id = animal_id
+    return animal
+
+
+def test_load_fills_cache(run):
+    cache = AnimalCache(InMemoryCacheBackend(max_size=10), ttl_seconds=60)
+
+    async def load():
+        return make_animal(1, age=3)
+
+    run(cache.get_or_load(1, load))
+
+    assert run(cache.backend.get("animal:1")) is not None
+    assert cache.generation(1) == 0
+
+
+def test_invalidation_during_load_skips_fill(run):
+    cache = AnimalCache(InMemoryCacheBackend(max_size=10), ttl_seconds=60)
+
+    async def scenario():
+        loading = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_load():
+            loading.set()
+            await release.wait()
+            return make_animal(1, age=3)
+
+        pending = asyncio.ensure_future(cache.get_or_load(1, slow_load))
+        await loading.wait()
+        await cache.invalidate(1)
+        release.set()
+
+        stale = await pending
+        return stale, await cache.backend.get("animal:1")
+
+    stale, cached = run(scenario())
+
+    assert stale.age == 3
+    assert cached is None
+    assert cache.generation(1) == 0
+
+
+def test_load_started_after_invalidation_fills_cache(run):
+    cache = AnimalCache(InMemoryCacheBackend(max_size=10), ttl_seconds=60)
+
+    async def scenario():
+        loading = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_load():
+            loading.set()
+            await release.wait()
+            return make_animal(1, age=3)
+
+        async def fresh_load():
+            return make_animal(1, age=4)
+
+        pending = asyncio.ensure_future(cache.get_or_load(1, slow_load))
+        await loading.wait()
+        await cache.invalidate(1)
+        fresh = await cache.get_or_load(1, fresh_load)
+        release.set()
+        await pending
+
+        return fresh, await cache.backend.get("animal:1")
+
+    fresh, cached = run(scenario())
+
+    assert fresh.age == 4
+    assert b'"age":4' in cached
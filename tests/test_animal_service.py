@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from tests.conftest import requires_database
+
+requires_database()
+
+from sqlalchemy import text
+
+from src.core.models.session_factory import pool_wait_stats
+from src.core.repositories.animals_cache import AnimalCache
+from src.core.repositories.uow import create_uow
+from src.core.services.animals_service import AnimalService
+from src.core.utils.cache import InMemoryCacheBackend
+from src.core.utils.single_flight import SingleFlight
+
+
+@pytest.fixture
+def zebra(clean_database, run):
+    async def seed() -> int:
+        async with clean_database.engine.begin() as connection:
+            res = await connection.execute(text("INSERT INTO animal (species, age, created_at) "
+                                                "VALUES ('zebra', 3, now()) RETURNING id"))
+            return res.scalar_one()
+
+    return run(seed())
+
+
+def make_service(single_flight: SingleFlight):
+    request_uow = create_uow()
+    service = AnimalService(
+        request_uow, cache=AnimalCache(InMemoryCacheBackend(max_size=10), ttl_seconds=60), single_flight=single_flight
+    )
+    return service, request_uow
+
+
+@pytest.mark.parametrize("read", [
+    lambda service, animal_id: service.get_animal_by_id(animal_id),
+    lambda service, animal_id: service.get_animals_by_species("zebra", limit=10),
+])
+def test_coalesced_read_survives_cancelled_leader(run, zebra, read):
+    single_flight = SingleFlight()
+
+    async def scenario():
+        leader, leader_uow = make_service(single_flight)
+        follower, follower_uow = make_service(single_flight)
+
+        # Оба запроса уже держат соединение, как после проверки токена без кеша
+        await leader_uow.session.get()
+        await follower_uow.session.get()
+        checkouts = pool_wait_stats.checkouts
+
+        leading = asyncio.ensure_future(read(leader, zebra))
+        await asyncio.sleep(0)
+        following = asyncio.ensure_future(read(follower, zebra))
+        await asyncio.sleep(0)
+
+        # Так get_uow закрывает сессию отменённого запроса
+        leading.cancel()
+        await leader_uow.close()
+
+        result = await asyncio.wait_for(following, timeout=10)
+        await follower_uow.close()
+        return result, pool_wait_stats.checkouts - checkouts
+
+    result, checkouts = run(scenario())
+
+    assert result is not None
+    # Загрузка идёт на соединении лидера, а не берёт из пула ещё одно
+    assert checkouts == 0
+    assert [stats["coalesced"] for stats in single_flight.stats().values()] == [1]
+
+
+def test_follower_releases_its_connection_before_waiting(clean_database, run, zebra):
+    single_flight = SingleFlight()
+    pool = clean_database.engine.pool
+
+    async def scenario():
+        leader, leader_uow = make_service(single_flight)
+        follower, follower_uow = make_service(single_flight)
+
+        async with clean_database.engine.connect() as editor:
+            # Блокировка таблицы задерживает загрузку лидера, пока ведомый её ждёт
+            await editor.execute(text("LOCK TABLE animal IN ACCESS EXCLUSIVE MODE"))
+            await follower_uow.session.get()
+
+            leading = asyncio.ensure_future(leader.get_animals_by_species("zebra", limit=10))
+            await asyncio.sleep(0.1)
+            following = asyncio.ensure_future(follower.get_animals_by_species("zebra", limit=10))
+            await asyncio.sleep(0.1)
+
+            # Заняты только соединения редактора и лидера
+            held_while_waiting = pool.checkedout()
+            await editor.commit()
+
+        await asyncio.wait_for(asyncio.gather(leading, following), timeout=10)
+        await leader_uow.close()
+        await follower_uow.close()
+        return held_while_waiting
+
+    assert run(scenario()) == 2
+    assert [stats["coalesced"] for stats in single_flight.stats().values()] == [1]
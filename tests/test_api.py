@@ -0,0 +1,108 @@
+import pytest
+
+from tests.conftest import requires_database
+
+requires_database()
+
+from benchmarks.clients import ASGIClient
+from src.core.models.session_factory import pool_wait_stats
+from src.core.repositories.animals_cache import animal_cache
+from src.core.utils.hashing_pool import hashing_pool
+from src.core.utils.token_cache import token_cache
+from src.main import app
+
+PASSWORD = "test-password"
+
+
+@pytest.fixture
+def client(clean_database):
+    return ASGIClient(app)
+
+
+@pytest.fixture
+def auth_headers(client, run):
+    response = run(client.request("POST", "/auth/register", json_body={"username": "keeper", "password": PASSWORD}))
+    assert response.status == 200, response.body
+    return {"authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.parametrize("path", ["/internal/pool", "/internal/cache", "/internal/single_flight",
+                                  "/internal/change_feed"])
+def test_internal_endpoints_require_auth(client, run, auth_headers, path):
+    assert run(client.request("GET", path)).status == 401
+    assert run(client.request("GET", path, headers=auth_headers)).status == 200
+
+
+def test_species_stats_are_serialized_as_json(client, run, auth_headers):
+    for age in (2, 4):
+        response = run(client.request("POST", "/animals/create_animal", headers=auth_headers,
+                                      json_body={"species": "zebra", "age": age}))
+        assert response.status == 200, response.body
+
+    response = run(client.request("GET", "/animals/stats/species", headers=auth_headers))
+
+    assert response.status == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [{"species": "zebra", "count": 2, "average_age": 3.0, "adopted": 0, "unadopted": 2}]
+
+
+def checkouts(run, request) -> int:
+    before = pool_wait_stats.checkouts
+    response = run(request)
+    assert response.status == 200, response.body
+    return pool_wait_stats.checkouts - before
+
+
+def test_authenticated_write_checks_out_one_connection(client, run, auth_headers):
+    response = run(client.request("POST", "/animals/create_animal", headers=auth_headers,
+                                  json_body={"species": "zebra", "age": 3}))
+    animal_id = response.json()["id"]
+    token_cache.clear()
+
+    assert checkouts(run, client.request("POST", f"/auth/adopt_animal/1/{animal_id}", headers=auth_headers)) <= 1
+
+
+def test_cached_read_checks_out_nothing(client, run, auth_headers):
+    response = run(client.request("POST", "/animals/create_animal", headers=auth_headers,
+                                  json_body={"species": "zebra", "age": 3}))
+    path = f"/animals/get_animal_by_id/{response.json()['id']}"
+    run(client.request("GET", path, headers=auth_headers))
+
+    assert checkouts(run, client.request("GET", path, headers=auth_headers)) == 0
+
+
+def test_uncached_read_checks_out_one_connection(client, run, auth_headers):
+    response = run(client.request("POST", "/animals/create_animal", headers=auth_headers,
+                                  json_body={"species": "zebra", "age": 3}))
+    animal_id = response.json()["id"]
+    run(animal_cache.invalidate(animal_id))
+    token_cache.clear()
+
+    assert checkouts(run, client.request("GET", f"/animals/get_animal_by_id/{animal_id}", headers=auth_headers)) <= 1
+
+
+def test_uncached_species_listing_checks_out_one_connection(client, run, auth_headers):
+    response = run(client.request("POST", "/animals/create_animal", headers=auth_headers,
+                                  json_body={"species": "zebra", "age": 3}))
+    assert response.status == 200, response.body
+    token_cache.clear()
+
+    path = "/animals/get_animals_by_species?species=zebra&limit=10"
+    assert checkouts(run, client.request("GET", path, headers=auth_headers)) <= 1
+
+
+def test_password_hashing_holds_no_connection(client, run, clean_database, monkeypatch):
+    held = []
+    hash_in_pool = hashing_pool.run
+
+    async def recording_run(func, *args):
+        held.append(clean_database.engine.pool.checkedout())
+        return await hash_in_pool(func, *args)
+
+    monkeypatch.setattr(hashing_pool, "run", recording_run)
+
+    credentials = {"username": "keeper", "password": PASSWORD}
+    assert run(client.request("POST", "/auth/register", json_body=credentials)).status == 200
+    assert run(client.request("POST", "/auth/login", form_body=credentials)).status == 200
+
+    assert held == [0, 0]
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from tests.conftest import requires_database
+
+requires_database()
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repositories.user_repository import UserRepository
+
+ADOPTERS = 8
+
+
+@pytest.fixture
+def contested_animal(clean_database, run):
+    async def seed() -> int:
+        async with clean_database.engine.begin() as connection:
+            await connection.execute(text(
+                'INSERT INTO "user" (username, hashed_password) '
+                "SELECT 'adopter' || n, 'x' FROM generate_series(1, :adopters) AS n"
+            ), {"adopters": ADOPTERS})
+            res = await connection.execute(text("INSERT INTO animal (species, age, created_at) "
+                                                "VALUES ('zebra', 3, now()) RETURNING id"))
+            return res.scalar_one()
+
+    return run(seed())
+
+
+def test_concurrent_adoptions_have_one_winner(clean_database, run, contested_animal):
+    async def adopt(user_id: int):
+        async with AsyncSession(bind=clean_database.engine) as session:
+            row = await UserRepository(session).adopt_animal(user_id=user_id, animal_id=contested_animal)
+            await session.commit()
+            return row
+
+    async def adopt_all():
+        return await asyncio.gather(
+            *(adopt(user_id) for user_id in range(1, ADOPTERS + 1)), return_exceptions=True
+        )
+
+    results = run(adopt_all())
+    winners = [result for result in results if not isinstance(result, BaseException)]
+    errors = [result for result in results if isinstance(result, BaseException)]
+
+    assert len(winners) == 1
+    assert all(isinstance(error, ValueError) for error in errors), errors
+
+    async def owner():
+        async with clean_database.engine.connect() as connection:
+            res = await connection.execute(text("SELECT master_id FROM animal WHERE id = :id"),
+                                           {"id": contested_animal})
+            return res.scalar_one()
+
+    assert run(owner()) == winners[0].master_id
+
+
+def test_bulk_adopt_reports_species_written_by_concurrent_update(clean_database, run, contested_animal):
+    async def scenario():
+        async with clean_database.engine.connect() as editor:
+            await editor.execute(text("UPDATE animal SET species = 'okapi' WHERE id = :id"), {"id": contested_animal})
+
+            async def adopt():
+                async with AsyncSession(bind=clean_database.engine) as session:
+                    rows = await UserRepository(session).adopt_animals(user_id=1, animal_ids=[contested_animal])
+                    await session.commit()
+                    return rows
+
+            adopting = asyncio.ensure_future(adopt())
+            # Массовое приручение должно встать в ожидание блокировки строки, взятой редактором
+            await asyncio.sleep(0.5)
+            assert not adopting.done()
+            await editor.commit()
+
+        return await adopting
+
+    [row] = run(scenario())
+
+    assert row.changed
+    assert row.species == "zebra"
+    assert row.changed_species == "okapi"
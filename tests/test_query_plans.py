@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from tests.conftest import requires_database
+
+requires_database()
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repositories.animals_repository import AnimalsRepository
+from src.core.utils.pagination import encode_cursor
+
+ANIMALS = 20000
+SPECIES = 50
+OWNERS = 200
+STARTED_AT = datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def seeded(database, run):
+    async def seed():
+        async with database.engine.begin() as connection:
+            await connection.execute(text('TRUNCATE animal, "user", species_stats RESTART IDENTITY CASCADE'))
+            await connection.execute(text(
+                'INSERT INTO "user" (username, hashed_password) '
+                "SELECT 'owner' || n, 'x' FROM generate_series(1, :owners) AS n"
+            ), {"owners": OWNERS})
+            await connection.execute(text(
+                "INSERT INTO animal (species, age, master_id, created_at) "
+                "SELECT 'species' || (n % :species), n % 30, "
+                "       CASE WHEN n % 2 = 0 THEN n % :owners + 1 END, "
+                "       CAST(:started_at AS timestamp) + n * interval '1 second' "
+                "FROM generate_series(1, :animals) AS n"
+            ), {"species": SPECIES, "owners": OWNERS, "animals": ANIMALS, "started_at": STARTED_AT})
+
+        # VACUUM переносит только что вставленные строки из pending list в GIN-индекс,
+        # иначе планировщик не считает индекс по триграммам выгодным
+        async with database.engine.connect() as connection:
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await connection.execute(text("VACUUM ANALYZE animal"))
+            await connection.execute(text('VACUUM ANALYZE "user"'))
+
+    run(seed())
+    return database
+
+
+def explain(database, run, query) -> str:
+    """Выполняет запрос репозитория и возвращает план последнего отправленного в базу SQL."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async def plan() -> str:
+        async with database.engine.connect() as connection:
+            event.listen(database.engine.sync_engine, "before_cursor_execute", capture)
+            try:
+                async with AsyncSession(bind=connection) as session:
+                    await query(AnimalsRepository(session))
+
+            finally:
+                event.remove(database.engine.sync_engine, "before_cursor_execute", capture)
+
+            statement, parameters = statements[-1]
+            res = await connection.exec_driver_sql("EXPLAIN " + statement, parameters)
+            return "\n".join(row[0] for row in res)
+
+    return run(plan())
+
+
+@pytest.mark.parametrize("name, query", [
+    ("species_page", lambda animals: animals.get_animals_by_species(species="species7", limit=50)),
+    ("species_page_cursor", lambda animals: animals.get_animals_by_species(
+        species="species7", limit=50, cursor=encode_cursor("id", ANIMALS // 2))),
+    ("owner_page", lambda animals: animals.get_animals_by_owner(owner_id=43, limit=50)),
+    ("owner_count", lambda animals: animals.count_by_owner(owner_id=43)),
+    ("created_at_page", lambda animals: animals.find_page(
+        limit=50, order_by="created_at",
+        cursor=encode_cursor("created_at", ANIMALS // 2, STARTED_AT + timedelta(seconds=ANIMALS // 2)))),
+])
+def test_hot_queries_use_indexes(seeded, run, name, query):
+    plan = explain(seeded, run, query)
+
+    assert "Seq Scan" not in plan, f"{name}:\n{plan}"
+
+
+@pytest.mark.parametrize("match, query", [("prefix", "XYZ"), ("substring", "XYZ")])
+def test_selective_species_search_uses_trigram_index(seeded, run, match, query):
+    plan = explain(seeded, run, lambda animals: animals.search_by_species(query=query, match=match, limit=50))
+
+    assert "ix_animal_species_trgm" in plan, plan
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from src.core.utils.cache import RedisCacheBackend
+
+
+class FakeRedis:
+    """Минимальный RESP-сервер: GET/SET/DEL, ответ на ключ "slow" задерживается до release."""
+
+    def __init__(self):
+        self.data = {}
+        self.connections = 0
+        self.release = asyncio.Event()
+        self._server = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                command = await self._read_command(reader)
+                writer.write(await self._reply(command))
+                await writer.drain()
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> list:
+        count = int((await reader.readuntil(b"\r\n"))[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+
+        return args
+
+    async def _reply(self, command: list) -> bytes:
+        name, *args = command
+        if name == b"GET":
+            if args[0] == b"slow":
+                await self.release.wait()
+
+            value = self.data.get(args[0])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+        if name == b"SET":
+            self.data[args[0]] = args[1]
+            return b"+OK\r\n"
+
+        if name == b"DEL":
+            return b":%d\r\n" % sum(self.data.pop(key, None) is not None for key in args)
+
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture
+def redis(run):
+    server = FakeRedis()
+    port = run(server.start())
+    backend = RedisCacheBackend(host="127.0.0.1", port=port, timeout=5)
+    yield server, backend
+    run(backend.close())
+    run(server.stop())
+
+
+def test_roundtrip(run, redis):
+    server, backend = redis
+
+    async def scenario():
+        await backend.set("animal:1", b"zebra", ttl_seconds=60)
+        stored = await backend.get("animal:1")
+        await backend.delete("animal:1")
+        return stored, await backend.get("animal:1")
+
+    assert run(scenario()) == (b"zebra", None)
+    assert server.connections == 1
+
+
+def test_cancelled_command_does_not_leak_reply(run, redis):
+    server, backend = redis
+    server.data.update({b"slow": b"stale", b"fresh": b"zebra"})
+
+    async def scenario():
+        pending = asyncio.ensure_future(backend.get("slow"))
+        await asyncio.sleep(0.1)
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+        # Сервер дописывает ответ на отменённую команду, следующий вызов не должен его прочесть
+        server.release.set()
+        return await backend.get("fresh")
+
+    assert run(scenario()) == b"zebra"
+    assert server.connections == 2
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from tests.conftest import requires_database
+
+requires_database()
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repositories.animals_repository import AnimalsRepository
+from src.core.repositories.repository import MAX_BIND_PARAMS
+
+
+def test_add_many_splits_batches_over_bind_parameter_limit(clean_database, run):
+    columns = ("species", "age", "created_at")
+    rows = [
+        {"species": "zebra", "age": n % 30, "created_at": datetime(2024, 1, 1)}
+        for n in range(MAX_BIND_PARAMS // len(columns) + 1000)
+    ]
+
+    async def add():
+        async with AsyncSession(bind=clean_database.engine) as session:
+            created = await AnimalsRepository(session).add_many(rows, batch_size=len(rows))
+            ids = {animal.id for animal in created}
+            await session.rollback()
+            return ids
+
+    ids = run(add())
+
+    assert len(ids) == len(rows)
+
+
+def count_statements(database, run, query) -> int:
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async def execute():
+        async with AsyncSession(bind=database.engine) as session:
+            animals = AnimalsRepository(session)
+            animal = await animals.add_one({"species": "zebra", "age": 3})
+            await session.flush()
+
+            event.listen(database.engine.sync_engine, "before_cursor_execute", count)
+            try:
+                await query(animals, animal.id)
+
+            finally:
+                event.remove(database.engine.sync_engine, "before_cursor_execute", count)
+                await session.rollback()
+
+    run(execute())
+    return len(statements)
+
+
+@pytest.mark.parametrize("name, query", [
+    ("edit_one", lambda animals, inst_id: animals.edit_one({"age": 4}, inst_id=inst_id)),
+    ("edit_one_with_previous", lambda animals, inst_id: animals.edit_one_with_previous({"age": 4}, inst_id=inst_id)),
+    ("delete_one", lambda animals, inst_id: animals.delete_one(inst_id=inst_id)),
+    ("delete_one_returning", lambda animals, inst_id: animals.delete_one_returning(inst_id=inst_id)),
+])
+def test_single_row_writes_take_one_statement(clean_database, run, name, query):
+    assert count_statements(clean_database, run, query) == 1, name
@@ -0,0 +1,14 @@
+from src.config.settings import db
+from src.core.models.session_factory import Database
+
+
+def test_pool_stats_report_own_limits():
+    instance = Database(db.copy(update={"pool_size": 2, "max_overflow": 3, "pool_timeout": 1.5}))
+
+    assert instance.pool_stats() == {}
+
+    # Движок создаётся лениво и без подключения к базе
+    instance.engine
+    stats = instance.pool_stats()
+
+    assert (stats["size"], stats["max_overflow"], stats["timeout"]) == (2, 3, 1.5)